@@ -0,0 +1,51 @@
+"""Shared helpers for the benchmark scripts in this directory."""
+import json
+import os
+import statistics
+import sys
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, List
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+
+@lru_cache(maxsize=None)
+def private_key_pem(key_size: int = 2048) -> str:
+    """Generate (once per size) a throwaway RSA key for benchmarking."""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=key_size)
+    return key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+
+
+def payload(size: int) -> bytes:
+    """Prose-like bytes of the given size (compressible, like real memories)."""
+    chunk = b"Decision: use early returns in Go handlers; keep SOPs short. "
+    return (chunk * (size // len(chunk) + 1))[:size]
+
+
+def measure(fn: Callable[[], Any], repeat: int = 5) -> Dict[str, float]:
+    """Run ``fn`` ``repeat`` times and return timing stats in seconds."""
+    samples: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return {
+        "min_s": min(samples),
+        "median_s": statistics.median(samples),
+        "max_s": max(samples),
+    }
+
+
+def emit(bench: str, **fields: Any) -> None:
+    """Write one machine-readable result line (JSON) to stdout."""
+    record = {"bench": bench, "cpu_count": os.cpu_count()}
+    record.update(fields)
+    json.dump(record, sys.stdout)
+    sys.stdout.write("\n")
+    sys.stdout.flush()
@@ -0,0 +1,146 @@
+"""
+Client and tool latency against the bundled fake API (benchmarks/fake_server.py).
+
+    uv run python benchmarks/bench_api.py [--pages 10,100,1000] [--latency-ms 0]
+        [--adds 200] [--concurrency 1,4,16]
+
+Prints one JSON line per case:
+
+- ``add_memory``: sequential ``MemoClient.add_memory`` throughput, and batch
+  ``AsyncMemoClient.add_memories`` throughput per concurrency level.
+- ``get_memories``: one full-mode page of N items through ``MemoClient``
+  (HTTP + JSON + decryption). The key cache is disabled so every item pays
+  the RSA unwrap, as with distinct real memories.
+- ``load_memories``: the MCP tool end to end (client, decryption, formatting)
+  in summary and full mode.
+
+The page cache (and the load_memories prefetch) is disabled everywhere so each
+call reaches the server.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import tempfile
+import time
+
+from _common import emit, measure, payload, private_key_pem
+from fake_server import FakeMemoServer
+from yomemoai_mcp.client import AsyncMemoClient, MemoClient
+
+
+def bench_add(server: FakeMemoServer, pem: str, args: argparse.Namespace) -> None:
+    content = payload(args.item_bytes).decode()
+    client = MemoClient("bench", pem, server.url, page_cache_size=0)
+    start = time.perf_counter()
+    for _ in range(args.adds):
+        client.add_memory(content, handle="bench")
+    elapsed = time.perf_counter() - start
+    client.close()
+    emit("add_memory", client="sync", concurrency=1, count=args.adds,
+         item_bytes=args.item_bytes, latency_ms=args.latency_ms,
+         total_s=elapsed, ops_per_s=args.adds / elapsed)
+
+    items = [{"content": content, "handle": "bench"} for _ in range(args.adds)]
+    for concurrency in [int(x) for x in args.concurrency.split(",")]:
+        async def run() -> float:
+            async with AsyncMemoClient(
+                "bench", pem, server.url, page_cache_size=0,
+                batch_concurrency=concurrency, max_connections=max(concurrency, 10),
+            ) as aclient:
+                start = time.perf_counter()
+                await aclient.add_memories(items)
+                return time.perf_counter() - start
+
+        elapsed = asyncio.run(run())
+        emit("add_memory", client="async_batch", concurrency=concurrency, count=args.adds,
+             item_bytes=args.item_bytes, latency_ms=args.latency_ms,
+             total_s=elapsed, ops_per_s=args.adds / elapsed)
+
+
+def bench_get(server: FakeMemoServer, pem: str, packed: str, args: argparse.Namespace) -> None:
+    client = MemoClient(
+        "bench", pem, server.url, page_cache_size=0, key_cache_size=0,
+        decrypt_workers=args.decrypt_workers)
+    for size in [int(x) for x in args.pages.split(",")]:
+        server.clear()
+        server.seed(packed, size, handle="bench")
+        stats = measure(lambda: client.get_memories(handle="bench", limit=size), args.repeat)
+        emit("get_memories", mode="full", page_size=size, item_bytes=args.item_bytes,
+             key_size=args.key_size, decrypt_workers=args.decrypt_workers,
+             latency_ms=args.latency_ms, items_per_s=size / stats["median_s"], **stats)
+    client.close()
+
+
+def bench_load(server: FakeMemoServer, pem: str, packed: str, args: argparse.Namespace) -> None:
+    with tempfile.NamedTemporaryFile("w", suffix=".pem", delete=False) as f:
+        f.write(pem)
+    os.environ.update(
+        MEMO_API_KEY="bench",
+        MEMO_PRIVATE_KEY_PATH=f.name,
+        MEMO_BASE_URL=server.url,
+        MEMO_PAGE_CACHE_SIZE="0",
+        MEMO_KEY_CACHE_SIZE="0",
+        MEMO_PREFETCH_MAX_BYTES="0",
+        MEMO_SEARCH_INDEX="false",
+        MEMO_DECRYPT_WORKERS=str(args.decrypt_workers),
+        # No output budget: otherwise a full page stops decrypting after ~60k characters
+        # and the benchmark no longer scales with the page size.
+        MEMO_MAX_RESULT_CHARS="0",
+        MEMO_MAX_CONTENT_CHARS="0",
+    )
+    from yomemoai_mcp import server as mcp_server  # reads configuration at import
+
+    logging.getLogger().setLevel(logging.WARNING)  # per-call INFO logs would dominate
+
+    async def run() -> None:
+        for size in [int(x) for x in args.pages.split(",")]:
+            server.clear()
+            server.seed(packed, size, handle="bench")
+            for mode in ("summary", "full"):
+                # The first call also builds the client; keep it out of the samples.
+                await mcp_server.load_memories(handle="bench", limit=size, mode=mode)
+                samples = []
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    await mcp_server.load_memories(handle="bench", limit=size, mode=mode)
+                    samples.append(time.perf_counter() - start)
+                emit("load_memories", mode=mode, page_size=size, item_bytes=args.item_bytes,
+                     key_size=args.key_size, decrypt_workers=args.decrypt_workers,
+                     latency_ms=args.latency_ms, min_s=min(samples),
+                     median_s=statistics.median(samples), max_s=max(samples))
+
+    try:
+        asyncio.run(run())
+    finally:
+        os.unlink(f.name)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", default="10,100,1000", help="page sizes (comma separated)")
+    parser.add_argument("--adds", type=int, default=200, help="memories per add_memory case")
+    parser.add_argument("--concurrency", default="1,4,16", help="batch concurrency levels")
+    parser.add_argument("--item-bytes", type=int, default=2048)
+    parser.add_argument("--key-size", type=int, default=2048)
+    parser.add_argument("--decrypt-workers", type=int, default=1)
+    parser.add_argument("--latency-ms", type=float, default=0.0,
+                        help="simulated server latency per request")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", choices=("add", "get", "load"), help="run a single case")
+    args = parser.parse_args()
+
+    pem = private_key_pem(args.key_size)
+    packed = MemoClient("bench", pem, "http://127.0.0.1").pack_data(payload(args.item_bytes))
+    with FakeMemoServer(latency=args.latency_ms / 1000) as server:
+        if args.only in (None, "add"):
+            bench_add(server, pem, args)
+        if args.only in (None, "get"):
+            bench_get(server, pem, packed, args)
+        if args.only in (None, "load"):
+            bench_load(server, pem, packed, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Decryption throughput of a full-mode page vs page size, worker count and key cache.
+
+    uv run python benchmarks/bench_decrypt.py [--sizes 10,100] [--workers 1,2,4,8]
+
+Prints one JSON line per (page size, workers, cache) combination. ``cache=cold``
+disables the unwrapped-key cache so every item pays the RSA private-key
+operation; ``cache=warm`` re-decrypts a page whose keys are already cached,
+as happens when the same page is fetched in summary and then full mode.
+"""
+import argparse
+import copy
+
+from _common import emit, measure, payload, private_key_pem
+from yomemoai_mcp.client import MemoClient
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="10,100", help="page sizes (comma separated)")
+    parser.add_argument("--workers", default="1,2,4,8", help="decrypt_workers values")
+    parser.add_argument("--item-bytes", type=int, default=64 * 1024)
+    parser.add_argument("--key-size", type=int, default=4096)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pem = private_key_pem(args.key_size)
+    packer = MemoClient("bench", pem, "http://127.0.0.1")
+    body = payload(args.item_bytes)
+
+    for size in [int(x) for x in args.sizes.split(",")]:
+        page = [{"id": str(i), "content": packer.pack_data(body)} for i in range(size)]
+        for workers in [int(x) for x in args.workers.split(",")]:
+            for cache in ("cold", "warm"):
+                client = MemoClient(
+                    "bench", pem, "http://127.0.0.1",
+                    decrypt_workers=workers,
+                    key_cache_size=size if cache == "warm" else 0,
+                )
+                if cache == "warm":
+                    client._decrypt_memories(copy.deepcopy(page))
+                stats = measure(lambda: client._decrypt_memories(copy.deepcopy(page)), args.repeat)
+                emit(
+                    "decrypt_page",
+                    page_size=size,
+                    workers=workers,
+                    cache=cache,
+                    item_bytes=args.item_bytes,
+                    key_size=args.key_size,
+                    items_per_s=size / stats["median_s"],
+                    key_cache=client.key_cache.stats(),
+                    **stats,
+                )
+                client.close()
+
+
+if __name__ == "__main__":
+    main()
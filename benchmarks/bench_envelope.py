@@ -0,0 +1,64 @@
+"""
+Wire size and encode/decode time of the v1 and v2 envelopes.
+
+    uv run python benchmarks/bench_envelope.py [--sizes 1024,65536,1048576,10485760]
+        [--compression none,zlib,zstd] [--key-sizes 2048,3072,4096] [--schemes rsa,x25519]
+
+Prints one JSON line per (key size, envelope version, key scheme, compression, content size).
+``overhead`` is wire bytes divided by plaintext bytes. The key cache is disabled so every
+decode includes the RSA unwrap (or X25519 exchange). The ``x25519`` scheme
+only exists in v2 envelopes; v1 combinations are skipped for it.
+"""
+import argparse
+
+from _common import emit, measure, payload, private_key_pem
+from yomemoai_mcp.client import MemoClient
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="1024,65536,1048576,10485760",
+                        help="content sizes in bytes (comma separated)")
+    parser.add_argument("--versions", default="1,2", help="envelope versions")
+    parser.add_argument("--compression", default="none,zlib",
+                        help="compression codecs (zstd needs the zstd extra)")
+    parser.add_argument("--key-sizes", default="2048", help="RSA key sizes (comma separated)")
+    parser.add_argument("--schemes", default="rsa,x25519", help="key schemes (comma separated)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    combos = [
+        (int(k), int(v), s, c)
+        for k in args.key_sizes.split(",")
+        for v in args.versions.split(",")
+        for s in args.schemes.split(",")
+        for c in args.compression.split(",")
+        if s == "rsa" or int(v) == 2
+    ]
+    for key_size, version, scheme, compression in combos:
+        pem = private_key_pem(key_size)
+        client = MemoClient(
+            "bench", pem, "http://127.0.0.1", key_cache_size=0,
+            envelope_version=version, key_scheme=scheme, compression=compression)
+        for size in [int(x) for x in args.sizes.split(",")]:
+            data = payload(size)
+            packed = client.pack_data(data)
+            encode = measure(lambda: client.pack_data(data), args.repeat)
+            decode = measure(lambda: client.unpack_and_decrypt(packed), args.repeat)
+            emit(
+                "envelope",
+                envelope_version=version,
+                key_scheme=scheme,
+                compression=compression,
+                key_size=key_size,
+                content_bytes=size,
+                wire_bytes=len(packed),
+                overhead=len(packed) / max(size, 1),
+                encode_median_s=encode["median_s"],
+                decode_median_s=decode["median_s"],
+            )
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
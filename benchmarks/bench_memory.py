@@ -0,0 +1,64 @@
+"""
+Peak memory of packing and decrypting one large memory.
+
+    uv run python benchmarks/bench_memory.py [--sizes 1048576,10485760,52428800] [--versions 1,2]
+
+Prints one JSON line per (envelope version, content size, operation). Peaks
+are measured with tracemalloc, which sees every buffer the envelope code and
+``cryptography`` allocate through Python. ``peak_ratio`` is the extra peak
+divided by the content size, not counting the input (the plaintext for
+``pack``; the stored envelope string for ``unpack``). ``unpack`` includes the
+UTF-8 decode to ``str`` that ``get_memories`` performs.
+"""
+import argparse
+import gc
+import tracemalloc
+
+from _common import emit, payload, private_key_pem
+from yomemoai_mcp.client import MemoClient
+
+
+def peak_bytes(fn) -> int:
+    """Extra bytes allocated at the peak of ``fn()``, excluding what was live before."""
+    gc.collect()
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak - base
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="1048576,10485760,52428800",
+                        help="content sizes in bytes (comma separated)")
+    parser.add_argument("--versions", default="1,2", help="envelope versions")
+    parser.add_argument("--key-size", type=int, default=2048)
+    args = parser.parse_args()
+
+    pem = private_key_pem(args.key_size)
+    for version in [int(v) for v in args.versions.split(",")]:
+        client = MemoClient("bench", pem, "http://127.0.0.1", envelope_version=version)
+        for size in [int(x) for x in args.sizes.split(",")]:
+            data = payload(size)
+            pack_peak = peak_bytes(lambda: client.pack_data(data))
+            packed = client.pack_data(data)
+            unpack_peak = peak_bytes(lambda: client.unpack_and_decrypt(packed).decode("utf-8"))
+            for op, peak in (("pack", pack_peak), ("unpack", unpack_peak)):
+                emit(
+                    "memory",
+                    op=op,
+                    envelope_version=version,
+                    content_bytes=size,
+                    wire_bytes=len(packed),
+                    peak_bytes=peak,
+                    peak_ratio=peak / size,
+                )
+            del packed
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
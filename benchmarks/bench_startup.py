@@ -0,0 +1,126 @@
+"""
+Server cold start: import cost and time to the first ``initialize`` response.
+
+    uv run python benchmarks/bench_startup.py [--repeat 5]
+
+Emits two kinds of JSON lines:
+
+- ``startup_import``: cumulative import time of ``yomemoai_mcp.server`` from
+  ``python -X importtime``, plus its slowest direct imports.
+- ``startup_initialize``: wall time from spawning ``python -m
+  yomemoai_mcp.server`` (stdio transport) until its reply to the MCP
+  ``initialize`` request arrives.
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+from _common import emit, private_key_pem
+
+_IMPORTTIME = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {},
+        "clientInfo": {"name": "bench", "version": "0"},
+    },
+}
+
+
+def server_env(key_path: str) -> dict:
+    env = dict(os.environ)
+    env.update(
+        MEMO_API_KEY="bench",
+        MEMO_PRIVATE_KEY_PATH=key_path,
+        MEMO_BASE_URL="http://127.0.0.1:9",
+    )
+    return env
+
+
+def import_profile(env: dict, top: int) -> None:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import yomemoai_mcp.server"],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME.match(line)
+        if match:
+            _, cumulative, indent, name = match.groups()
+            rows.append((name, int(cumulative), len(indent)))
+    total, children = None, []
+    for i, (name, cumulative, depth) in enumerate(rows):
+        if name != "yomemoai_mcp.server":
+            continue
+        total = cumulative
+        # importtime lists a module's direct imports just before it, one level deeper.
+        for child, child_cumulative, child_depth in reversed(rows[:i]):
+            if child_depth <= depth:
+                break
+            if child_depth == depth + 2:
+                children.append((child, child_cumulative))
+        break
+    children.sort(key=lambda r: -r[1])
+    emit(
+        "startup_import",
+        server_cumulative_us=total,
+        slowest=[{"module": name, "cumulative_us": c} for name, c in children[:top]],
+        loads_cryptography=any(name.startswith("cryptography") for name, _, _ in rows),
+    )
+
+
+def time_to_initialize(env: dict) -> float:
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "yomemoai_mcp.server"],
+        env=env, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL, text=True,
+    )
+    try:
+        proc.stdin.write(json.dumps(INITIALIZE) + "\n")
+        proc.stdin.flush()
+        while True:
+            line = proc.stdout.readline()
+            if not line:
+                raise RuntimeError("server exited before answering initialize")
+            if json.loads(line).get("id") == 1:
+                return time.perf_counter() - start
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5, help="slowest imports to report")
+    args = parser.parse_args()
+
+    with tempfile.NamedTemporaryFile("w", suffix=".pem", delete=False) as f:
+        f.write(private_key_pem(2048))
+    try:
+        env = server_env(f.name)
+        import_profile(env, args.top)
+        samples = sorted(time_to_initialize(env) for _ in range(args.repeat))
+        emit(
+            "startup_initialize",
+            repeat=args.repeat,
+            min_s=samples[0],
+            median_s=samples[len(samples) // 2],
+            max_s=samples[-1],
+        )
+    finally:
+        os.unlink(f.name)
+
+
+if __name__ == "__main__":
+    main()
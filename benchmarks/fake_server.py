@@ -0,0 +1,245 @@
+"""
+Local stand-in for the YoMemo ``/api/v1/memory`` endpoint.
+
+    uv run python benchmarks/fake_server.py [--port 8787] [--latency-ms 20] [--fail-rate 0.05]
+
+Implements what the client uses: ``POST`` (create, or update by ``idempotent_key``,
+which sets ``updated_at``), ``GET`` with ``handle``/``limit``/``cursor`` pagination
+and the ``only_metadata`` / ``only_summary`` modes. Stored ciphertext is opaque,
+so any envelope version works. Latency and error injection are configurable for
+benchmarking retries and concurrency. Not a conformance test of the real API.
+"""
+import argparse
+import itertools
+import json
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+PATH = "/api/v1/memory"
+
+
+class FakeMemoServer:
+    """
+    In-memory fake API served from a background thread.
+
+    :param port: Port to bind (0 picks a free one)
+    :param latency: Seconds to sleep before answering each request
+    :param fail_rate: Probability (0..1) that a request fails with ``fail_status``
+    :param fail_status: HTTP status used for injected failures
+    """
+
+    def __init__(
+        self,
+        port: int = 0,
+        latency: float = 0.0,
+        fail_rate: float = 0.0,
+        fail_status: int = 503,
+        host: str = "127.0.0.1",
+    ):
+        self.latency = latency
+        self.fail_rate = fail_rate
+        self.fail_status = fail_status
+        self.retry_after = "0"  # sent with injected 429/503 failures
+        self.memories: List[Dict[str, Any]] = []  # newest first
+        self.requests = 0
+        self._fail_next = 0
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeMemoServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeMemoServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def fail_next(
+        self, count: int, status: Optional[int] = None, retry_after: Optional[str] = None
+    ) -> None:
+        """Fail the next ``count`` requests, regardless of ``fail_rate``."""
+        with self._lock:
+            self._fail_next = count
+            if status is not None:
+                self.fail_status = status
+            if retry_after is not None:
+                self.retry_after = retry_after
+
+    def clear(self) -> None:
+        with self._lock:
+            self.memories.clear()
+
+    def seed(
+        self,
+        ciphertext: str,
+        count: int,
+        handle: str = "general",
+        description: str = "seeded memory",
+    ) -> None:
+        """Insert ``count`` memories sharing one ciphertext (decryption cost is per item)."""
+        with self._lock:
+            for _ in range(count):
+                self._insert(handle, ciphertext, description, {}, "")
+
+    def _insert(
+        self, handle: str, ciphertext: str, description: str, metadata: Dict[str, Any], key: str
+    ) -> Dict[str, Any]:
+        n = next(self._ids)
+        created = datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=n)
+        memory = {
+            "id": str(n),
+            "handle": handle,
+            "content": ciphertext,
+            "description": description,
+            "metadata": metadata,
+            "idempotent_key": key or f"idem-{n}",
+            "created_at": created.isoformat().replace("+00:00", "Z"),
+        }
+        self.memories.insert(0, memory)
+        return memory
+
+    def _should_fail(self) -> bool:
+        with self._lock:
+            self.requests += 1
+            if self._fail_next > 0:
+                self._fail_next -= 1
+                return True
+        return self.fail_rate > 0 and random.random() < self.fail_rate
+
+    def handle_post(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        key = body.get("idempotent_key") or ""
+        with self._lock:
+            if key:
+                for memory in self.memories:
+                    if memory["idempotent_key"] == key:
+                        memory.update(
+                            content=body.get("ciphertext", ""),
+                            description=body.get("description", ""),
+                            updated_at=datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+                        )
+                        return {"memory_id": memory["id"], "idempotent_key": key}
+            memory = self._insert(
+                body.get("handle") or "general",
+                body.get("ciphertext", ""),
+                body.get("description", ""),
+                body.get("metadata") or {},
+                key,
+            )
+        return {"memory_id": memory["id"], "idempotent_key": memory["idempotent_key"]}
+
+    def handle_get(self, query: Dict[str, str]) -> Dict[str, Any]:
+        handle = query.get("handle")
+        limit = int(query.get("limit") or 20)
+        start = int(query.get("cursor") or 0)
+        with self._lock:
+            items = [m for m in self.memories if not handle or m["handle"] == handle]
+            page = [dict(m) for m in items[start:start + limit]]
+        for memory in page:
+            if query.get("only_metadata") == "true":
+                memory.pop("content")
+                memory.pop("description")
+            elif query.get("only_summary") == "true":
+                memory.pop("content")
+        end = start + limit
+        return {
+            "data": page,
+            "next_cursor": str(end) if end < len(items) else "",
+            "total": len(items),
+        }
+
+
+def _make_handler(server: FakeMemoServer) -> type:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True  # headers and body are separate writes
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+        def _send(self, status: int, obj: Dict[str, Any]) -> None:
+            data = json.dumps(obj).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            if status in (429, 503):
+                self.send_header("Retry-After", server.retry_after)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _begin(self) -> bool:
+            """Apply latency and error injection; return False if the request was answered."""
+            if server.latency:
+                time.sleep(server.latency)
+            if urlparse(self.path).path != PATH:
+                self._send(404, {"error": "not found"})
+                return False
+            if not self.headers.get("X-Memo-API-Key"):
+                self._send(401, {"error": "missing api key"})
+                return False
+            if server._should_fail():
+                self._send(server.fail_status, {"error": "injected failure"})
+                return False
+            return True
+
+        def do_POST(self) -> None:
+            raw = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            if not self._begin():
+                return
+            try:
+                body = json.loads(raw)
+            except ValueError:
+                self._send(400, {"error": "invalid json"})
+                return
+            self._send(200, server.handle_post(body))
+
+        def do_GET(self) -> None:
+            if not self._begin():
+                return
+            query = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+            self._send(200, server.handle_get(query))
+
+    return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    parser.add_argument("--fail-status", type=int, default=503)
+    args = parser.parse_args()
+
+    server = FakeMemoServer(
+        args.port, args.latency_ms / 1000, args.fail_rate, args.fail_status, host=args.host)
+    print(f"Fake YoMemo API on {server.url} (MEMO_BASE_URL={server.url})", flush=True)
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
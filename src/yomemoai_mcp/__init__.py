@@ -1,4 +1,10 @@
 """YoMemoAI MCP Server - Model Context Protocol server for YoMemoAI."""
-from importlib.metadata import version
 
-__version__ = version("yomemoai-mcp")
+
+def __getattr__(name: str):
+    # Resolved lazily: importlib.metadata is slow to import and the server
+    # entry point imports this package on every cold start.
+    if name == "__version__":
+        from importlib.metadata import version
+        return version("yomemoai-mcp")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
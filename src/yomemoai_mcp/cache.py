@@ -0,0 +1,348 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def _zero(buf: bytearray) -> None:
+    for i in range(len(buf)):
+        buf[i] = 0
+
+
+class KeyCache:
+    """
+    Bounded LRU cache of unwrapped per-memory AES keys.
+
+    Keyed by SHA-256 of the RSA-wrapped key, so a memory that is decrypted
+    again (e.g. summary -> full re-fetch of the same page) skips the RSA
+    private-key operation. Entries expire after ``ttl`` seconds and the
+    cache's own copy of the key bytes is overwritten with zeros when
+    evicted, expired or cleared. ``get()`` returns an immutable copy, which
+    is not wiped.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 3600.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[bytes, Tuple[bytearray, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _digest(wrapped_key: bytes) -> bytes:
+        return hashlib.sha256(wrapped_key).digest()
+
+    def get(self, wrapped_key: bytes) -> Optional[bytes]:
+        digest = self._digest(wrapped_key)
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                self.misses += 1
+                return None
+            key, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[digest]
+                _zero(key)
+                self.evictions += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(digest)
+            self.hits += 1
+            # A copy: the stored bytearray is zeroed on eviction, possibly while the caller uses it.
+            return bytes(key)
+
+    def put(self, wrapped_key: bytes, key: bytes) -> None:
+        if self.max_size <= 0:
+            return
+        digest = self._digest(wrapped_key)
+        with self._lock:
+            old = self._entries.pop(digest, None)
+            if old is not None:
+                _zero(old[0])
+            self._entries[digest] = (bytearray(key), time.monotonic() + self.ttl)
+            while len(self._entries) > self.max_size:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                _zero(evicted)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry, zeroing key material first."""
+        with self._lock:
+            for key, _ in self._entries.values():
+                _zero(key)
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+PageKey = Tuple[str, int, str, str]
+
+# Fields each lightweight mode leaves out; used to derive a cheaper page
+# from a richer cached one (full -> summary -> metadata).
+_MODE_DROPS = {
+    "full": (),
+    "summary": ("content",),
+    "metadata": ("content", "description"),
+}
+_MODE_RANK = {"metadata": 0, "summary": 1, "full": 2}
+_MODE_SOURCES = {
+    "full": ("full",),
+    "summary": ("summary", "full"),
+    "metadata": ("metadata", "summary", "full"),
+}
+
+
+class PageCache:
+    """
+    Read-through cache of raw ``GET /api/v1/memory`` pages.
+
+    Pages are keyed by ``(handle, limit, cursor, mode)`` and hold memory ids;
+    the items themselves are stored once per id exactly as the server sent
+    them, so full-mode content stays encrypted at rest in memory. A summary
+    or metadata request is answered from a cached full (or summary) page of
+    the same cursor when one exists. Writes to a handle invalidate its pages
+    and the all-handles pages.
+    """
+
+    def __init__(self, max_pages: int = 64, ttl: float = 120.0):
+        self.max_pages = max_pages
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._pages: "OrderedDict[PageKey, Tuple[List[str], str, int, float]]" = OrderedDict()
+        self._items: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_pages > 0 and self.ttl > 0
+
+    def get(
+        self, handle: str, limit: int, cursor: str, mode: str
+    ) -> Optional[Tuple[List[Dict[str, Any]], str, int]]:
+        """Return ``(memories, next_cursor, total)`` copies, or None on a miss."""
+        if not self.enabled:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            for source in _MODE_SOURCES[mode]:
+                key = (handle, limit, cursor, source)
+                entry = self._pages.get(key)
+                if entry is None:
+                    continue
+                ids, next_cursor, total, expires_at = entry
+                if expires_at <= now:
+                    del self._pages[key]
+                    continue
+                rank = _MODE_RANK[source]
+                if any(self._items.get(i, (-1,))[0] < rank for i in ids):
+                    continue
+                self._pages.move_to_end(key)
+                self.hits += 1
+                drops = _MODE_DROPS[mode]
+                memories = [
+                    {k: v for k, v in self._items[i][1].items() if k not in drops}
+                    for i in ids
+                ]
+                return memories, next_cursor, total
+            self.misses += 1
+            return None
+
+    def put(
+        self,
+        handle: str,
+        limit: int,
+        cursor: str,
+        mode: str,
+        memories: List[Dict[str, Any]],
+        next_cursor: str,
+        total: int,
+    ) -> None:
+        """Store a page as received from the server (before decryption)."""
+        if not self.enabled:
+            return
+        if any(m.get("id") is None for m in memories):
+            # Can't index it; don't cache a page we can't rebuild.
+            return
+        ids = []
+        rank = _MODE_RANK[mode]
+        with self._lock:
+            for m in memories:
+                mem_id = str(m["id"])
+                ids.append(mem_id)
+                current = self._items.get(mem_id)
+                # Never replace a full item with a lighter view of it.
+                if current is None or rank >= current[0]:
+                    self._items[mem_id] = (rank, dict(m))
+            key = (handle, limit, cursor, mode)
+            self._pages[key] = (ids, next_cursor, total, time.monotonic() + self.ttl)
+            self._pages.move_to_end(key)
+            if len(self._pages) > self.max_pages:
+                while len(self._pages) > self.max_pages:
+                    self._pages.popitem(last=False)
+                self._prune_items()
+
+    def get_item(self, mem_id: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the richest cached view of one memory, if any."""
+        with self._lock:
+            entry = self._items.get(str(mem_id))
+            return dict(entry[1]) if entry is not None else None
+
+    def invalidate_handle(self, handle: str) -> None:
+        """Forget pages and items that a write to ``handle`` may have changed."""
+        with self._lock:
+            # Page keys hold the handle as queried; fold it the way writes are
+            # normalized so "Work Stuff" pages are dropped by a "work-stuff" write.
+            stale = [k for k in self._pages
+                     if not k[0] or k[0].replace(" ", "-").lower() == handle]
+            for key in stale:
+                del self._pages[key]
+            for mem_id in [i for i, m in self._items.items() if m[1].get("handle") == handle]:
+                del self._items[mem_id]
+            self._prune_items()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pages.clear()
+            self._items.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "pages": len(self._pages),
+                "items": len(self._items),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def _prune_items(self) -> None:
+        live = {i for ids, _, _, _ in self._pages.values() for i in ids}
+        for mem_id in [i for i in self._items if i not in live]:
+            del self._items[mem_id]
+
+
+class PrefetchCache:
+    """
+    Full pages decrypted ahead of request, bounded by the memory they hold.
+
+    Filled in the background after a summary page is served, so the usual
+    follow-up ``mode="full"`` call for the same cursor skips the fetch and
+    the decryption. Keyed by ``(handle, limit, cursor)``; entries expire
+    after ``ttl`` seconds and the least recently used pages are dropped once
+    their content exceeds ``max_bytes``. Pages may be decrypted only up to
+    the budget: the first ``ready`` memories hold plaintext, the rest still
+    hold ciphertext. Like the search index it keeps plaintext in memory, but
+    only briefly; writes to a handle invalidate its pages.
+    """
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024, ttl: float = 60.0):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Bumped on every invalidation; a prefetch started before it is discarded.
+        self.generation = 0
+        self._bytes = 0
+        self._pages: "OrderedDict[Tuple[str, int, str], Tuple[List[Dict[str, Any]], str, int, int, int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0 and self.ttl > 0
+
+    def get(
+        self, handle: str, limit: int, cursor: str
+    ) -> Optional[Tuple[List[Dict[str, Any]], str, int, int]]:
+        """Return ``(memories, next_cursor, total, ready)`` copies, or None on a miss."""
+        key = (handle, limit, cursor)
+        with self._lock:
+            entry = self._pages.get(key)
+            if entry is not None and entry[5] <= time.monotonic():
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._pages.move_to_end(key)
+            self.hits += 1
+            memories, next_cursor, total, ready, _, _ = entry
+            return [dict(m) for m in memories], next_cursor, total, ready
+
+    def put(
+        self,
+        handle: str,
+        limit: int,
+        cursor: str,
+        memories: List[Dict[str, Any]],
+        next_cursor: str,
+        total: int,
+        ready: int,
+        size: int,
+        generation: int,
+    ) -> bool:
+        """Store a page prefetched under ``generation``; returns False if it was dropped."""
+        if not self.enabled or size > self.max_bytes:
+            return False
+        key = (handle, limit, cursor)
+        with self._lock:
+            if generation != self.generation:
+                return False
+            if key in self._pages:
+                self._drop(key)
+            self._pages[key] = (memories, next_cursor, total, ready, size,
+                                time.monotonic() + self.ttl)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                self._drop(next(iter(self._pages)))
+                self.evictions += 1
+        return True
+
+    def invalidate_handle(self, handle: str) -> None:
+        """Forget pages that a write to ``handle`` may have changed."""
+        with self._lock:
+            self.generation += 1
+            for key in [k for k in self._pages
+                        if not k[0] or k[0].replace(" ", "-").lower() == handle]:
+                self._drop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._pages.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "pages": len(self._pages),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def __contains__(self, key: Tuple[str, int, str]) -> bool:
+        """True if a live page is stored under ``key`` (does not count as a hit)."""
+        with self._lock:
+            entry = self._pages.get(key)
+            return entry is not None and entry[5] > time.monotonic()
+
+    def _drop(self, key: Tuple[str, int, str]) -> None:
+        self._bytes -= self._pages.pop(key)[4]
+
+    def __len__(self) -> int:
+        return len(self._pages)
@@ -1,42 +1,124 @@
+import asyncio
 import base64
+import binascii
+from concurrent.futures import ThreadPoolExecutor
 from cryptography.hazmat.primitives.ciphers.modes import GCM
 import json
 import logging
+import queue
+import re
+import struct
+import sys
+import threading
 import time
+import zlib
+import httpx
 import requests
-from typing import Dict, List, Optional, Tuple, Any
+import urllib3
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union, Any
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey, X25519PublicKey
+from cryptography.hazmat.primitives.asymmetric import utils as asym_utils
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.backends import default_backend
 import os
 
+from .cache import KeyCache, PageCache, PrefetchCache
+from .errors import MemoRequestError
+from .metrics import metrics
+from .retry import RetryPolicy
+from .search import SearchIndex
+from .sync_store import SyncStore, change_stamp
+
 logger = logging.getLogger(__name__)
 
+# v2 envelope: a single binary frame, base64-encoded once.
+#   magic "YM" | version | flags | scheme | wrapped-key len (u16) | signature len (u16)
+#   | nonce (12) | tag (16) | wrapped key | signature | ciphertext
+# v1 envelopes are base64(JSON) and therefore never start with the magic.
+_V2_MAGIC = b"YM"
+_V2_HEADER = struct.Struct(">2sBBBHH")
+_SCHEME_RSA = 1  # RSA-OAEP-SHA256 key wrap, RSA-PKCS1v15-SHA256 signature
+# Ephemeral-static X25519 + HKDF-SHA256 per-memory key (the wrapped-key field
+# holds the 32-byte ephemeral public key), Ed25519 signature over the SHA-256
+# of the signed bytes. Both keys are derived from the RSA private key.
+_SCHEME_X25519 = 2
+_KEY_SCHEMES = {"rsa": _SCHEME_RSA, "x25519": _SCHEME_X25519}
+_ED25519_SIG_LEN = 64
 
-class MemoRequestError(Exception):
-    def __init__(
-        self,
-        message: str,
-        url: str,
-        payload: Dict,
-        status_code: Optional[int] = None,
-        response_text: Optional[str] = None,
-    ):
-        super().__init__(message)
-        self.url = url
-        self.payload = payload
-        self.status_code = status_code
-        self.response_text = response_text
+# v1 envelope "data" field: unescaped base64, so it can be located in the raw JSON bytes.
+_V1_DATA = re.compile(rb'"data"\s*:\s*"([A-Za-z0-9+/=]*)"')
+
+# Optional pre-encryption compression. v2 records the codec id in the low
+# bits of the flags byte; v1 records the name in a "compression" JSON field.
+_CODECS = {"zlib": 1, "zstd": 2}
+_CODEC_NAMES = {v: k for k, v in _CODECS.items()}
+_CODEC_MASK = 0x03
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    if codec == "zlib":
+        return zlib.compress(data, 6)
+    import zstandard
+    return zstandard.ZstdCompressor(level=3).compress(data)
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zlib":
+        return zlib.decompress(data)
+    if codec == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            raise ValueError(
+                "Memory is zstd-compressed but zstandard is not installed. "
+                "Install with: pip install \"yomemoai-mcp[zstd]\" (or uv sync --extra zstd)"
+            )
+        return zstandard.ZstdDecompressor().decompress(data)
+    raise ValueError(f"Unsupported compression: {codec}")
 
 
-class MemoClient:
+def memory_ref(result: Any) -> Tuple[Optional[str], Optional[str]]:
+    """Extract ``(memory_id, idempotent_key)`` from an add-memory API response."""
+    if not isinstance(result, dict):
+        return None, None
+    memory_id = result.get("memory_id")
+    idempotent_key = result.get("idempotent_key")
+    if not memory_id and result.get("data") and isinstance(result["data"], list) and len(result["data"]) > 0:
+        first = result["data"][0]
+        memory_id = first.get("id")
+        idempotent_key = first.get("idempotent_key") or idempotent_key
+    return memory_id, idempotent_key
+
+
+class _MemoBase:
     """
-    Client for yomemoai API
-    It's a wrapper for the yomemoai API.
+    Shared key handling, envelope format and request/response shaping for
+    the sync and async yomemoai clients. Subclasses only provide transport.
     """
 
-    def __init__(self, api_key: str, private_key_pem: str, base_url: str):
+    def __init__(
+        self,
+        api_key: str,
+        private_key_pem: str,
+        base_url: str,
+        decrypt_workers: int = 1,
+        key_cache_size: int = 1024,
+        key_cache_ttl: float = 3600.0,
+        page_cache_size: int = 64,
+        page_cache_ttl: float = 120.0,
+        batch_concurrency: int = 4,
+        envelope_version: int = 1,
+        key_scheme: str = "rsa",
+        compression: str = "none",
+        compression_min_size: int = 1024,
+        retry: Optional[RetryPolicy] = None,
+        search_index: Optional[SearchIndex] = None,
+        sync_store: Optional[SyncStore] = None,
+    ):
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')
         self.private_key = serialization.load_pem_private_key(
@@ -45,9 +127,38 @@ class MemoClient:
             backend=default_backend()
         )
         self.public_key = self.private_key.public_key()
-        self.session = requests.Session()
-        self.session.headers.update(
-            {"X-Memo-API-Key": self.api_key, "Content-Type": "application/json"})
+        self.decrypt_workers = max(1, decrypt_workers)
+        self._decrypt_pool: Optional[ThreadPoolExecutor] = None
+        self.key_cache = KeyCache(max_size=key_cache_size, ttl=key_cache_ttl)
+        self.page_cache = PageCache(max_pages=page_cache_size, ttl=page_cache_ttl)
+        self.batch_concurrency = max(1, batch_concurrency)
+        if envelope_version not in (1, 2):
+            raise ValueError(f"Unsupported envelope_version: {envelope_version}")
+        self.envelope_version = envelope_version
+        if key_scheme not in _KEY_SCHEMES:
+            raise ValueError(f"Unsupported key_scheme: {key_scheme}")
+        if key_scheme != "rsa" and envelope_version != 2:
+            raise ValueError(f"key_scheme={key_scheme!r} requires envelope_version=2")
+        self.key_scheme = key_scheme
+        self._ec_keys: Optional[Tuple[X25519PrivateKey, bytes, Ed25519PrivateKey]] = None
+        if compression not in ("none", *_CODECS):
+            raise ValueError(f"Unsupported compression: {compression}")
+        if compression == "zstd":
+            try:
+                import zstandard  # noqa: F401
+            except ImportError:
+                raise ImportError(
+                    "zstandard not installed. Install with: pip install \"yomemoai-mcp[zstd]\" "
+                    "(or uv sync --extra zstd)")
+        self.compression = compression
+        self.compression_min_size = compression_min_size
+        self.retry = retry or RetryPolicy()
+        self.search_index = search_index
+        self.sync_store = sync_store
+
+    @property
+    def _headers(self) -> Dict[str, str]:
+        return {"X-Memo-API-Key": self.api_key, "Content-Type": "application/json"}
 
     def _normalize_pem(self, pem_str: str) -> bytes:
         pem_str = pem_str.strip()
@@ -56,75 +167,278 @@ class MemoClient:
         return pem_str.encode()
 
     def pack_data(self, raw_data: bytes) -> str:
-        aes_key = os.urandom(32)
-        nonce = os.urandom(12)
+        """Encrypt and sign ``raw_data`` into the configured envelope version."""
+        if self.envelope_version == 2:
+            return self._pack_v2(raw_data)
+        return self._pack_v1(raw_data)
 
-        cipher = Cipher(algorithms.AES(aes_key), modes.GCM(
-            nonce), backend=default_backend())
-        encryptor = cipher.encryptor()
-        ciphertext = encryptor.update(raw_data) + encryptor.finalize()
+    def _maybe_compress(self, raw_data: bytes) -> Tuple[bytes, str]:
+        """Compress when enabled, above the size threshold, and actually smaller."""
+        if self.compression == "none" or len(raw_data) < self.compression_min_size:
+            return raw_data, ""
+        compressed = _compress(raw_data, self.compression)
+        if len(compressed) >= len(raw_data):
+            return raw_data, ""
+        return compressed, self.compression
 
-        combined_data = base64.b64encode(
-            nonce + ciphertext + encryptor.tag).decode('utf-8')
+    def _encrypt_into(
+        self, raw_data: bytes, frame: bytearray, offset: int, aes_key: bytes, nonce: bytes
+    ) -> bytes:
+        """
+        AES-256-GCM ``raw_data`` straight into ``frame[offset:]``; returns the tag.
 
-        encrypted_key = self.public_key.encrypt(
-            aes_key,
-            padding.OAEP(mgf=padding.MGF1(algorithm=hashes.SHA256()),
-                         algorithm=hashes.SHA256(), label=None)
-        )
-        key_base64 = base64.b64encode(encrypted_key).decode('utf-8')
+        ``frame`` needs ``len(raw_data) + 15`` writable bytes from ``offset``
+        (the slack ``update_into`` requires), so no intermediate ciphertext
+        buffer is allocated.
+        """
+        with metrics.span("encrypt"):
+            encryptor = Cipher(algorithms.AES(aes_key), modes.GCM(
+                nonce), backend=default_backend()).encryptor()
+            with memoryview(frame)[offset:] as out:
+                encryptor.update_into(raw_data, out)
+            encryptor.finalize()
+        return encryptor.tag
 
-        signature = self.private_key.sign(
-            combined_data.encode('utf-8'),
-            padding.PKCS1v15(),
-            hashes.SHA256()
-        )
-        sig_base64 = base64.b64encode(signature).decode('utf-8')
+    def _wrap_key(self, aes_key: bytes) -> bytes:
+        with metrics.span("rsa_wrap"):
+            return self.public_key.encrypt(
+                aes_key,
+                padding.OAEP(mgf=padding.MGF1(algorithm=hashes.SHA256()),
+                             algorithm=hashes.SHA256(), label=None)
+            )
 
-        pkg = {
-            "data": combined_data,
-            "key": key_base64,
-            "signature": sig_base64
-        }
-        return base64.b64encode(json.dumps(pkg).encode()).decode()
+    def _sign(self, *parts: Any) -> bytes:
+        """PKCS#1 v1.5 / SHA-256 signature over the concatenation of ``parts``."""
+        with metrics.span("sign"):
+            if len(parts) == 1:
+                return self.private_key.sign(parts[0], padding.PKCS1v15(), hashes.SHA256())
+            # Hash the pieces in place instead of joining them into one copy.
+            digest = hashes.Hash(hashes.SHA256())
+            for part in parts:
+                digest.update(part)
+            return self.private_key.sign(
+                digest.finalize(), padding.PKCS1v15(), asym_utils.Prehashed(hashes.SHA256()))
 
-    def unpack_and_decrypt(self, encrypted_pkg_base64: str) -> bytes:
-        pkg_json = base64.b64decode(encrypted_pkg_base64)
-        pkg = json.loads(pkg_json)
+    def _derived_keys(self) -> Tuple[X25519PrivateKey, bytes, Ed25519PrivateKey]:
+        """
+        X25519 and Ed25519 keys derived from the RSA private key.
 
-        if "key" in pkg and pkg["key"]:
-            encrypted_key = base64.b64decode(pkg["key"])
+        HKDF over the private exponent, so every client holding the same RSA
+        key derives the same pair and no extra key material has to be stored.
+        Returns ``(x25519 private key, x25519 public bytes, ed25519 key)``.
+        """
+        if self._ec_keys is None:
+            d = self.private_key.private_numbers().d
+            ikm = d.to_bytes((d.bit_length() + 7) // 8, "big")
+
+            def derive(info: bytes) -> bytes:
+                return HKDF(algorithm=hashes.SHA256(), length=32,
+                            salt=b"yomemo-envelope", info=info).derive(ikm)
+
+            x_key = X25519PrivateKey.from_private_bytes(derive(b"x25519 key agreement"))
+            self._ec_keys = (x_key, x_key.public_key().public_bytes_raw(),
+                             Ed25519PrivateKey.from_private_bytes(derive(b"ed25519 signature")))
+        return self._ec_keys
+
+    @staticmethod
+    def _memory_key(shared: bytes, ephemeral: bytes, static: bytes) -> bytes:
+        return HKDF(algorithm=hashes.SHA256(), length=32, salt=None,
+                    info=b"yomemo memory key" + ephemeral + static).derive(shared)
+
+    def _agree_key(self) -> Tuple[bytes, bytes]:
+        """New per-memory AES key from an ephemeral X25519 exchange; returns ``(aes_key, ephemeral public)``."""
+        _, static, _ = self._derived_keys()
+        with metrics.span("x25519_wrap"):
+            ephemeral_key = X25519PrivateKey.generate()
+            ephemeral = ephemeral_key.public_key().public_bytes_raw()
+            shared = ephemeral_key.exchange(X25519PublicKey.from_public_bytes(static))
+            return self._memory_key(shared, ephemeral, static), ephemeral
+
+    def _recover_key(self, ephemeral: bytes) -> bytes:
+        """X25519 counterpart of ``_unwrap_key``, served from the key cache when possible."""
+        aes_key = self.key_cache.get(ephemeral)
+        if aes_key is not None:
+            return aes_key
+        x_key, static, _ = self._derived_keys()
+        with metrics.span("x25519_unwrap"):
+            shared = x_key.exchange(X25519PublicKey.from_public_bytes(ephemeral))
+            aes_key = self._memory_key(shared, ephemeral, static)
+        self.key_cache.put(ephemeral, aes_key)
+        return aes_key
+
+    def _sign_ed25519(self, *parts: Any) -> bytes:
+        """Ed25519 signature over the SHA-256 of ``parts``, hashed in place like ``_sign``."""
+        with metrics.span("sign"):
+            digest = hashes.Hash(hashes.SHA256())
+            for part in parts:
+                digest.update(part)
+            return self._derived_keys()[2].sign(digest.finalize())
+
+    def _pack_v1(self, raw_data: bytes) -> str:
+        raw_data, codec = self._maybe_compress(raw_data)
+        aes_key, nonce = os.urandom(32), os.urandom(12)
+        size = len(raw_data)
+
+        # nonce | ciphertext | tag; the tag slot doubles as update_into's slack.
+        combined = bytearray(12 + size + 16)
+        tag = self._encrypt_into(raw_data, combined, 12, aes_key, nonce)
+        combined[:12] = nonce
+        combined[12 + size:] = tag
+        combined_data = base64.b64encode(combined)
+        del combined
+
+        key_base64 = base64.b64encode(self._wrap_key(aes_key))
+        sig_base64 = base64.b64encode(self._sign(combined_data))
+
+        # Same bytes json.dumps would produce, without round-tripping the payload through str.
+        parts = [b'{"data": "', combined_data, b'", "key": "', key_base64,
+                 b'", "signature": "', sig_base64, b'"']
+        if codec:
+            parts += [b', "compression": "', codec.encode(), b'"']
+        parts.append(b"}")
+        pkg = b"".join(parts)
+        del parts, combined_data
+        encoded = base64.b64encode(pkg)
+        del pkg
+        return encoded.decode("ascii")
+
+    def _pack_v2(self, raw_data: bytes) -> str:
+        raw_data, codec = self._maybe_compress(raw_data)
+        scheme = _KEY_SCHEMES[self.key_scheme]
+        nonce = os.urandom(12)
+        if scheme == _SCHEME_X25519:
+            aes_key, encrypted_key = self._agree_key()
+            sig_len = _ED25519_SIG_LEN
+        else:
+            aes_key = os.urandom(32)
+            encrypted_key = self._wrap_key(aes_key)
+            sig_len = self.private_key.key_size // 8
+        key_len = len(encrypted_key)
+        size = len(raw_data)
+
+        # Lay out the whole frame once and encrypt into its tail (+15 bytes of slack).
+        head = _V2_HEADER.size + 28 + key_len
+        body = head + sig_len
+        frame = bytearray(body + size + 15)
+        tag = self._encrypt_into(raw_data, frame, body, aes_key, nonce)
+        _V2_HEADER.pack_into(
+            frame, 0, _V2_MAGIC, 2, _CODECS.get(codec, 0), scheme, key_len, sig_len)
+        offset = _V2_HEADER.size
+        frame[offset:offset + 12] = nonce
+        frame[offset + 12:offset + 28] = tag
+        frame[offset + 28:head] = encrypted_key
+        # The signature covers every other byte of the frame.
+        sign = self._sign_ed25519 if scheme == _SCHEME_X25519 else self._sign
+        with memoryview(frame) as view:
+            signature = sign(view[:head], view[body:body + size])
+        if len(signature) != sig_len:
+            raise ValueError("Unexpected signature length")
+        frame[head:body] = signature
+        del frame[body + size:]
+        encoded = base64.b64encode(frame)
+        del frame
+        return encoded.decode("ascii")
+
+    def _unwrap_key(self, encrypted_key: bytes) -> bytes:
+        """RSA-OAEP unwrap of a per-memory AES key, served from the key cache when possible."""
+        aes_key = self.key_cache.get(encrypted_key)
+        if aes_key is not None:
+            return aes_key
+        with metrics.span("rsa_unwrap"):
             aes_key = self.private_key.decrypt(
                 encrypted_key,
                 padding.OAEP(mgf=padding.MGF1(algorithm=hashes.SHA256()),
                              algorithm=hashes.SHA256(), label=None)
             )
+        self.key_cache.put(encrypted_key, aes_key)
+        return aes_key
 
-            combined_data = base64.b64decode(pkg["data"])
-            nonce = combined_data[:12]
-            tag = combined_data[-16:]
-            ciphertext = combined_data[12:-16]
-
+    def _decrypt_gcm(self, aes_key: bytes, nonce: Any, tag: Any, ciphertext: Any) -> bytearray:
+        """AES-GCM decrypt of a buffer (e.g. a memoryview) into one preallocated bytearray."""
+        with metrics.span("decrypt"):
             cipher = Cipher[GCM](algorithms.AES(aes_key), modes.GCM(
-                nonce, tag), backend=default_backend())
+                bytes(nonce), bytes(tag)), backend=default_backend())
             decryptor = cipher.decryptor()
-            return decryptor.update(ciphertext) + decryptor.finalize()
+            plaintext = bytearray(len(ciphertext) + 15)
+            with memoryview(plaintext) as out:
+                written = decryptor.update_into(ciphertext, out)
+            decryptor.finalize()
+            del plaintext[written:]
+            return plaintext
+
+    def unpack_and_decrypt(self, encrypted_pkg_base64: str) -> Union[bytes, bytearray]:
+        """
+        Decrypt a stored envelope, detecting v1 (JSON) or v2 (binary frame).
+
+        Returns a ``bytearray``, or ``bytes`` when the payload was decompressed
+        or RSA-encrypted directly.
+        Large payloads are decoded and decrypted through memoryviews, so the
+        plaintext is produced with about one extra payload-sized buffer.
+        """
+        # binascii reads an ASCII str in place; base64.b64decode would copy it first.
+        raw = binascii.a2b_base64(encrypted_pkg_base64)
+        if raw[:2] == _V2_MAGIC:
+            return self._unpack_v2(raw)
+
+        match = _V1_DATA.search(raw)
+        if match is not None:
+            # Decode the large "data" field straight out of the JSON bytes and
+            # parse only the small remainder, so the payload never becomes a str.
+            start, end = match.span(1)
+            pkg = json.loads(raw[:start] + raw[end:])
+            with memoryview(raw)[start:end] as data:
+                combined_data = binascii.a2b_base64(data)
+        else:
+            pkg = json.loads(raw)
+            combined_data = binascii.a2b_base64(pkg.get("data") or "")
+        del raw, match
+
+        if "key" in pkg and pkg["key"]:
+            encrypted_key = binascii.a2b_base64(pkg["key"])
+            aes_key = self._unwrap_key(encrypted_key)
+
+            with memoryview(combined_data) as view:
+                plaintext = self._decrypt_gcm(aes_key, view[:12], view[-16:], view[12:-16])
+            del combined_data
+            if pkg.get("compression"):
+                return _decompress(plaintext, pkg["compression"])
+            return plaintext
         else:
-            data = base64.b64decode(pkg["data"])
             return self.private_key.decrypt(
-                data,
+                combined_data,
                 padding.OAEP(mgf=padding.MGF1(algorithm=hashes.SHA256()),
                              algorithm=hashes.SHA256(), label=None)
             )
 
-    def add_memory(
+    def _unpack_v2(self, frame: bytes) -> Union[bytes, bytearray]:
+        _, version, flags, scheme, key_len, sig_len = _V2_HEADER.unpack_from(frame)
+        if version != 2 or scheme not in (_SCHEME_RSA, _SCHEME_X25519):
+            raise ValueError(f"Unsupported envelope: version={version} scheme={scheme}")
+        offset = _V2_HEADER.size
+        with memoryview(frame) as view:
+            nonce = view[offset:offset + 12]
+            tag = view[offset + 12:offset + 28]
+            offset += 28
+            encrypted_key = bytes(view[offset:offset + key_len])
+            offset += key_len + sig_len
+            if scheme == _SCHEME_X25519:
+                aes_key = self._recover_key(encrypted_key)
+            else:
+                aes_key = self._unwrap_key(encrypted_key)
+            plaintext = self._decrypt_gcm(aes_key, nonce, tag, view[offset:])
+        codec = flags & _CODEC_MASK
+        if codec:
+            return _decompress(plaintext, _CODEC_NAMES.get(codec, str(codec)))
+        return plaintext
+
+    def _build_memory_payload(
         self,
         content: str,
-        handle: str = "",
-        description: str = "",
-        metadata: Dict = None,
-        idempotent_key: str = "",
-    ):
+        handle: str,
+        description: str,
+        metadata: Optional[Dict],
+        idempotent_key: str,
+    ) -> Dict[str, Any]:
         # Ensure handle is not empty (API requires it)
         if not handle or not handle.strip():
             handle = "general"
@@ -140,52 +454,347 @@ class MemoClient:
             handle, token_size, len(description or ""), idempotent_key or "(new)",
             (content[:80] + "..." if len(content) > 80 else content)[:100],
         )
-
-        packed = self.pack_data(content.encode('utf-8'))
-        logger.debug(f"Packed data length: {len(packed)}")
-
-        payload = {
-            "ciphertext": packed,
+        return {
             "description": description,
             "handle": handle,
             "metadata": metadata or {
                 "token_size": token_size,
                 "from": "yomemoai-mcp",
+            },
+            "idempotent_key": idempotent_key.strip() if idempotent_key else "",
+        }
+
+    def _finish_memory_payload(self, payload: Dict[str, Any], packed: str) -> Dict[str, Any]:
+        logger.debug(f"Packed data length: {len(packed)}")
+        full = {"ciphertext": packed}
+        full.update(payload)
+        if not full["idempotent_key"]:
+            del full["idempotent_key"]
+        return full
+
+    def _raise_for_api_error(self, url: str, payload: Dict, status_code: int, text: str, body: Any) -> None:
+        # Provide better error messages
+        error_detail = body.get("error", text) if isinstance(body, dict) else text
+        logger.error(f"API error {status_code}: {error_detail}")
+        raise MemoRequestError(
+            f"API error {status_code}: {error_detail}",
+            url=url,
+            payload=payload,
+            status_code=status_code,
+            response_text=text,
+        )
+
+    def _log_add_response(self, result: Dict) -> None:
+        logger.debug(f"Success response: {result}")
+        mem_id = result.get("memory_id") or (result.get("data") or [{}])[0].get("id") if result.get("data") else None
+        idem_key = result.get("idempotent_key") or (result.get("data") or [{}])[0].get("idempotent_key") if result.get("data") else None
+        logger.info(
+            "add_memory response: memory_id=%s idempotent_key=%s response_keys=%s",
+            mem_id, idem_key, list(result.keys()) if isinstance(result, dict) else type(result).__name__,
+        )
+
+    @staticmethod
+    def _batch_result(index: int, result: Any = None, error: Optional[Exception] = None) -> Dict[str, Any]:
+        if error is not None:
+            return {
+                "index": index,
+                "ok": False,
+                "error": str(error),
+                "status_code": getattr(error, "status_code", None),
             }
+        memory_id, idempotent_key = memory_ref(result)
+        return {
+            "index": index,
+            "ok": bool(memory_id),
+            "memory_id": memory_id,
+            "idempotent_key": idempotent_key,
+            "error": None if memory_id else "no memory id in response",
+        }
+
+    def _memory_query(
+        self,
+        handle: Optional[str],
+        limit: int,
+        cursor: str,
+        only_metadata: bool,
+        only_summary: bool,
+    ) -> Dict[str, Any]:
+        params: Dict[str, Any] = {}
+        if handle:
+            params["handle"] = handle
+        if limit > 0:
+            params["limit"] = limit
+        if cursor:
+            params["cursor"] = cursor
+        if only_metadata:
+            params["only_metadata"] = "true"
+        if only_summary:
+            params["only_summary"] = "true"
+        return params
+
+    def _page_key(
+        self, handle: Optional[str], limit: int, cursor: str, only_metadata: bool, only_summary: bool
+    ) -> Tuple[str, int, str, str]:
+        mode = "metadata" if only_metadata else "summary" if only_summary else "full"
+        return handle or "", limit, cursor, mode
+
+    @staticmethod
+    def _count_bytes(sent: Any, received: bytes) -> None:
+        if metrics.enabled:
+            if isinstance(sent, str):
+                sent = sent.encode()
+            metrics.incr("bytes_sent", len(sent or b""))
+            metrics.incr("bytes_received", len(received))
+
+    def _parse_memories_body(self, body: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], str, int]:
+        memories = body.get("data", [])
+        if memories is None:
+            memories = []
+        next_cursor = body.get("next_cursor") or ""
+        total = body.get("total")
+        if total is None:
+            total = 0
+        try:
+            total = int(total)
+        except (TypeError, ValueError):
+            total = 0
+        return memories, next_cursor, total
+
+    def _cached_full_item(self, memory_id: str) -> Optional[Dict[str, Any]]:
+        item = self.page_cache.get_item(memory_id)
+        return item if item is not None and "content" in item else None
+
+    @staticmethod
+    def _pick(memories: List[Dict[str, Any]], memory_id: str) -> Optional[Dict[str, Any]]:
+        return next((m for m in memories if str(m.get("id")) == str(memory_id)), None)
+
+    def _sync_start(self, since: Optional[str]) -> Tuple[bool, str]:
+        """Return ``(full, cutoff)``: re-download everything, or also anything changed at or after ``cutoff``."""
+        if self.sync_store is None:
+            raise ValueError("sync() needs a client created with sync_store")
+        if since == "":
+            return True, ""
+        return False, change_stamp({"created_at": since}) if since else ""
+
+    def _sync_select(self, page: List[Dict[str, Any]], full: bool, cutoff: str) -> List[str]:
+        """
+        Return the ids on a metadata page whose content must be downloaded.
+
+        A memory is wanted when it is not stored yet or its change stamp
+        differs from the stored one. The API lists memories by creation time,
+        so an old memory updated recently can sit on any page; every page is
+        checked rather than stopping at the previous sync point.
+        """
+        known = self.sync_store.stamps(m["id"] for m in page if m.get("id") is not None)
+        wanted = []
+        for m in page:
+            if m.get("id") is None:
+                continue
+            memory_id, stamp = str(m["id"]), change_stamp(m)
+            if full or known.get(memory_id) != stamp or (cutoff and stamp >= cutoff):
+                wanted.append(memory_id)
+        return wanted
+
+    def _decrypt_one(self, m: Dict[str, Any]) -> bool:
+        content = m.get("content")
+        if not content:
+            return False
+        try:
+            with metrics.span("decrypt_item"):
+                decrypted = self.unpack_and_decrypt(content)
+                m["content"] = decrypted.decode("utf-8")
+            return True
+        except Exception as e:
+            logger.warning("Decryption failed for %s: %s", m.get("id"), e)
+            metrics.incr("decryption_failures")
+            m["content"] = "(decryption failed)"
+            return False
+
+    def _decrypt_memories(self, memories: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Decrypt each memory's ``content`` in place, marking failures per item.
+        Returns which items were decrypted.
+
+        With ``decrypt_workers > 1`` items are spread over a thread pool; the
+        RSA and AES-GCM primitives in ``cryptography`` release the GIL, so a
+        full page scales with cores. Items are updated in place, so page
+        order is unchanged.
+        """
+        if self.decrypt_workers == 1 or len(memories) < 2:
+            decrypted = [self._decrypt_one(m) for m in memories]
+        else:
+            if self._decrypt_pool is None:
+                self._decrypt_pool = ThreadPoolExecutor(
+                    max_workers=self.decrypt_workers, thread_name_prefix="memo-decrypt")
+            # list() drains the iterator so every item has finished before we return.
+            decrypted = list(self._decrypt_pool.map(self._decrypt_one, memories))
+        if self.search_index is not None:
+            self.search_index.upsert(m for m, ok in zip(memories, decrypted) if ok)
+        return decrypted
+
+    def _on_saved(self, payload: Dict[str, Any], content: Optional[str], result: Dict) -> None:
+        """Keep local caches, the search index and the sync store in step with a successful save."""
+        self._invalidate_saved(payload)
+        self._store_saved(payload, content, result)
+
+    def _invalidate_saved(self, payload: Dict[str, Any]) -> None:
+        """Drop cached pages of the saved memory's handle (in memory only)."""
+        self.page_cache.invalidate_handle(payload["handle"])
+
+    def _store_saved(self, payload: Dict[str, Any], content: Optional[str], result: Dict) -> None:
+        """Write a saved memory to the search index and sync store (disk I/O when file-backed)."""
+        memory_id, idempotent_key = memory_ref(result)
+        if not memory_id:
+            return
+        memory = {
+            "id": memory_id,
+            "handle": payload["handle"],
+            "idempotent_key": idempotent_key or payload.get("idempotent_key"),
+            "description": payload["description"],
+            "metadata": payload.get("metadata"),
+            "content": content,
         }
-        if idempotent_key and idempotent_key.strip():
-            payload["idempotent_key"] = idempotent_key.strip()
+        if self.search_index is not None and content is not None:
+            self.search_index.upsert([memory])
+        if self.sync_store is not None:
+            if content is not None:
+                self.sync_store.put(memory)
+            else:
+                # No plaintext (e.g. a replayed queue entry): drop the now stale copy.
+                self.sync_store.discard(memory_id)
+
+    def _shutdown(self) -> None:
+        if self._decrypt_pool is not None:
+            self._decrypt_pool.shutdown(wait=False)
+            self._decrypt_pool = None
+        self.key_cache.clear()
+        self.page_cache.clear()
+        # Drop the parsed RSA key and the keys derived from it; OpenSSL clears
+        # its key material when it is freed.
+        self.private_key = None
+        self._ec_keys = None
+
+
+class MemoClient(_MemoBase):
+    """
+    Client for yomemoai API
+    It's a wrapper for the yomemoai API.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        private_key_pem: str,
+        base_url: str,
+        max_connections: int = 10,
+        timeout: float = 30.0,
+        connect_timeout: float = 5.0,
+        decrypt_workers: int = 1,
+        key_cache_size: int = 1024,
+        key_cache_ttl: float = 3600.0,
+        page_cache_size: int = 64,
+        page_cache_ttl: float = 120.0,
+        batch_concurrency: int = 4,
+        envelope_version: int = 1,
+        key_scheme: str = "rsa",
+        compression: str = "none",
+        compression_min_size: int = 1024,
+        retry: Optional[RetryPolicy] = None,
+        search_index: Optional[SearchIndex] = None,
+        sync_store: Optional[SyncStore] = None,
+    ):
+        super().__init__(
+            api_key, private_key_pem, base_url,
+            decrypt_workers=decrypt_workers,
+            key_cache_size=key_cache_size,
+            key_cache_ttl=key_cache_ttl,
+            page_cache_size=page_cache_size,
+            page_cache_ttl=page_cache_ttl,
+            batch_concurrency=batch_concurrency,
+            envelope_version=envelope_version,
+            key_scheme=key_scheme,
+            compression=compression,
+            compression_min_size=compression_min_size,
+            retry=retry,
+            search_index=search_index,
+            sync_store=sync_store,
+        )
+        self.timeout = (connect_timeout, timeout)
+        self.session = requests.Session()
+        self.session.headers.update(self._headers)
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=max_connections, pool_maxsize=max_connections)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    @staticmethod
+    def _connect_failed(e: requests.exceptions.RequestException) -> bool:
+        """True if the connection could not be opened, so the request never reached the server."""
+        if isinstance(e, requests.exceptions.ConnectTimeout):
+            return True
+        if isinstance(e, requests.exceptions.ConnectionError) and e.args:
+            # Refused / unresolvable: urllib3 reports NewConnectionError as the reason.
+            # Other ConnectionErrors (e.g. a reset mid-response) may follow a sent request.
+            reason = getattr(e.args[0], "reason", e.args[0])
+            return isinstance(reason, urllib3.exceptions.NewConnectionError)
+        return False
+
+    def _request(self, method: str, url: str, idempotent: bool, **kwargs: Any) -> requests.Response:
+        """Send a request, retrying per ``self.retry``; see :class:`RetryPolicy`."""
+        attempt = 0
+        while True:
+            try:
+                with metrics.span("http", method=method):
+                    resp = self.session.request(method, url, timeout=self.timeout, **kwargs)
+            except requests.exceptions.RequestException as e:
+                safe = idempotent or self._connect_failed(e)
+                if not self.retry.should_retry(attempt, safe):
+                    raise
+                delay = self.retry.delay(attempt)
+                reason = f"{type(e).__name__}: {e}"
+            else:
+                self._count_bytes(resp.request.body, resp.content)
+                if not self.retry.should_retry(attempt, idempotent, resp.status_code):
+                    return resp
+                delay = self.retry.delay(attempt, resp.headers.get("Retry-After"))
+                reason = f"HTTP {resp.status_code}"
+                resp.close()
+            attempt += 1
+            logger.warning("Retrying %s %s in %.2fs (%s/%s) after %s",
+                           method, url, delay, attempt, self.retry.max_retries, reason)
+            time.sleep(delay)
+
+    def add_memory(
+        self,
+        content: str,
+        handle: str = "",
+        description: str = "",
+        metadata: Dict = None,
+        idempotent_key: str = "",
+    ):
+        payload = self._build_memory_payload(
+            content, handle, description, metadata, idempotent_key)
+        payload = self._finish_memory_payload(
+            payload, self.pack_data(content.encode('utf-8')))
 
         url = f"{self.base_url}/api/v1/memory"
         logger.debug(f"POST {url}")
 
         try:
-            resp = self.session.post(url, json=payload)
+            resp = self._request(
+                "POST", url, idempotent="idempotent_key" in payload, json=payload)
             logger.debug(f"Response status: {resp.status_code}")
 
-            # Provide better error messages
             if not resp.ok:
                 try:
-                    error_detail = resp.json().get("error", resp.text)
+                    body = resp.json()
                 except Exception:
-                    error_detail = resp.text
-                logger.error(f"API error {resp.status_code}: {error_detail}")
-                raise MemoRequestError(
-                    f"API error {resp.status_code}: {error_detail}",
-                    url=url,
-                    payload=payload,
-                    status_code=resp.status_code,
-                    response_text=resp.text,
-                )
+                    body = None
+                self._raise_for_api_error(url, payload, resp.status_code, resp.text, body)
 
             result = resp.json()
-            logger.debug(f"Success response: {result}")
-            mem_id = result.get("memory_id") or (result.get("data") or [{}])[0].get("id") if result.get("data") else None
-            idem_key = result.get("idempotent_key") or (result.get("data") or [{}])[0].get("idempotent_key") if result.get("data") else None
-            logger.info(
-                "add_memory response: memory_id=%s idempotent_key=%s response_keys=%s",
-                mem_id, idem_key, list(result.keys()) if isinstance(result, dict) else type(result).__name__,
-            )
+            self._log_add_response(result)
+            self._on_saved(payload, content, result)
             return result
         except requests.exceptions.RequestException as e:
             logger.error(f"Request failed: {type(e).__name__}: {str(e)}")
@@ -194,10 +803,56 @@ class MemoClient:
                 url=url,
                 payload=payload,
             ) from e
+        except MemoRequestError:
+            raise
         except Exception as e:
             logger.error(f"Unexpected error: {type(e).__name__}: {str(e)}")
             raise
 
+    def add_memories(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Save several memories concurrently.
+
+        Each item takes the keyword arguments of :meth:`add_memory`
+        (``content`` is required). Up to ``batch_concurrency`` items are
+        encrypted, signed and posted at once over the shared session.
+
+        :return: One result per item, in input order: ``index``, ``ok``,
+            ``memory_id``, ``idempotent_key`` and ``error``. A failed item
+            does not stop the others.
+        """
+        def save(indexed: Tuple[int, Dict[str, Any]]) -> Dict[str, Any]:
+            index, item = indexed
+            try:
+                return self._batch_result(index, self.add_memory(**item))
+            except Exception as e:
+                logger.warning("add_memories item %s failed: %s", index, e)
+                return self._batch_result(index, error=e)
+
+        if not items:
+            return []
+        workers = min(self.batch_concurrency, len(items))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="memo-save") as pool:
+            return list(pool.map(save, enumerate(items)))
+
+    def _fetch_page(
+        self,
+        handle: Optional[str],
+        limit: int,
+        cursor: str,
+        only_metadata: bool,
+        only_summary: bool,
+    ) -> Tuple[List[Dict[str, Any]], str, int]:
+        """GET one page as the server returns it (content still encrypted)."""
+        url = f"{self.base_url}/api/v1/memory"
+        params = self._memory_query(handle, limit, cursor, only_metadata, only_summary)
+
+        resp = self._request("GET", url, idempotent=True, params=params)
+        resp.raise_for_status()
+        with metrics.span("json_decode"):
+            body = resp.json()
+        return self._parse_memories_body(body)
+
     def get_memories(
         self,
         handle: Optional[str] = None,
@@ -205,6 +860,7 @@ class MemoClient:
         cursor: str = "",
         only_metadata: bool = False,
         only_summary: bool = False,
+        decrypt: bool = True,
     ) -> Tuple[List[Dict[str, Any]], str, int]:
         """
         Fetch memories with optional pagination and lightweight modes.
@@ -214,47 +870,622 @@ class MemoClient:
         :param cursor: Pagination cursor from previous response's next_cursor.
         :param only_metadata: If True, return only id/handle/created_at/metadata (no content/description); saves tokens.
         :param only_summary: If True, return description + metadata but no encrypted content; saves tokens.
+        :param decrypt: If False, full-mode content is returned still encrypted so the caller can
+            decrypt only the items it uses with :meth:`decrypt_memories`.
         :return: (list of memory dicts, next_cursor for pagination, total count matching the query).
         """
-        url = f"{self.base_url}/api/v1/memory"
-        params: Dict[str, Any] = {}
-        if handle:
-            params["handle"] = handle
-        if limit > 0:
-            params["limit"] = limit
-        if cursor:
-            params["cursor"] = cursor
-        if only_metadata:
-            params["only_metadata"] = "true"
-        if only_summary:
-            params["only_summary"] = "true"
+        page_key = self._page_key(handle, limit, cursor, only_metadata, only_summary)
+        cached = self.page_cache.get(*page_key)
+        if cached is not None:
+            memories, next_cursor, total = cached
+        else:
+            memories, next_cursor, total = self._fetch_page(
+                handle, limit, cursor, only_metadata, only_summary)
+            self.page_cache.put(*page_key, memories, next_cursor, total)
 
-        resp = self.session.get(url, params=params)
-        resp.raise_for_status()
-        body = resp.json()
-        memories = body.get("data", [])
-        if memories is None:
-            memories = []
-        next_cursor = body.get("next_cursor") or ""
-        total = body.get("total")
-        if total is None:
-            total = 0
+        # Decrypt content only when we requested full content (no lightweight mode).
+        if decrypt and not only_metadata and not only_summary:
+            self._decrypt_memories(memories)
+
+        return memories, next_cursor, total
+
+    def decrypt_memories(self, memories: List[Dict[str, Any]]) -> None:
+        """Decrypt ``content`` in place for memories fetched with ``decrypt=False``."""
+        self._decrypt_memories(memories)
+
+    def find_memory(
+        self, memory_id: str, handle: Optional[str] = None, limit: int = 100
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return one memory with decrypted content, or None if it does not exist.
+
+        A full view in the page cache is used when present. Otherwise pages are
+        walked in metadata mode to locate the memory, then only its page is
+        fetched in full (and cached, so reading the next range of a long
+        content is served locally) and only the matching item is decrypted.
+        The copy in ``sync_store`` may be out of date, so it is only returned
+        when the API cannot be reached.
+
+        :param memory_id: The memory ID.
+        :param handle: Optional. Narrow the walk to one handle.
+        :param limit: Page size used for the walk.
+        """
+        memory = self._cached_full_item(memory_id)
+        cursor = ""
         try:
-            total = int(total)
-        except (TypeError, ValueError):
-            total = 0
+            while memory is None:
+                page_cursor = cursor
+                page, cursor, _ = self._fetch_page(handle, limit, cursor, True, False)
+                if self._pick(page, memory_id) is not None:
+                    page, _, _ = self.get_memories(handle, limit, page_cursor, decrypt=False)
+                    memory = self._pick(page, memory_id)
+                    if memory is None:
+                        return None  # deleted between the two requests
+                elif not cursor or not page:
+                    return None
+        except (MemoRequestError, requests.exceptions.RequestException) as e:
+            stored = self.sync_store.get(memory_id) if self.sync_store is not None else None
+            if stored is None:
+                raise
+            logger.warning("find_memory: API unavailable (%s); returning the local copy", e)
+            return stored
+        self._decrypt_memories([memory])
+        return memory
 
-        # Decrypt content only when we requested full content (no lightweight mode).
-        if not only_metadata and not only_summary:
-            for m in memories:
-                content = m.get("content")
-                if not content:
+    def sync(
+        self, handle: Optional[str] = None, since: Optional[str] = None, limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """
+        Pull new and changed memories into ``sync_store``.
+
+        Every page is first listed in metadata mode and each memory's change
+        stamp (``updated_at`` when the API sends it, else ``created_at``) is
+        compared with the stored one. Only pages holding new or changed
+        memories are then fetched in full, and only those items decrypted.
+        A repeat sync therefore costs one small metadata request per page.
+        Updates are only visible when the API reports ``updated_at``; saves
+        made through this client update the store directly.
+
+        :param handle: Optional. Sync one handle; each handle records its own "last seen" watermark.
+        :param since: Optional ISO-8601 time; also re-download memories changed
+            since then ("" = full resync).
+        :param limit: Page size.
+        :return: The new or changed memories, decrypted.
+        """
+        full, cutoff = self._sync_start(since)
+        newest = self.sync_store.watermark(handle)
+        wanted: List[Tuple[str, List[str]]] = []
+        cursor = ""
+        while True:
+            page_cursor = cursor
+            page, cursor, _ = self._fetch_page(handle, limit, cursor, True, False)
+            ids = self._sync_select(page, full, cutoff)
+            if ids:
+                wanted.append((page_cursor, ids))
+            newest = max([newest] + [change_stamp(m) for m in page])
+            if not cursor or not page:
+                break
+        changed: List[Dict[str, Any]] = []
+        for page_cursor, ids in wanted:
+            page, _, _ = self._fetch_page(handle, limit, page_cursor, False, False)
+            fresh = [m for m in page if str(m.get("id")) in ids]
+            ok = self._decrypt_memories(fresh)
+            changed.extend(m for m, decrypted in zip(fresh, ok) if decrypted)
+        self.sync_store.merge(handle, changed, newest)
+        logger.info("sync: handle=%s changed=%s watermark=%s", handle or "(all)", len(changed), newest)
+        return changed
+
+    def iter_memories(
+        self,
+        handle: Optional[str] = None,
+        limit: int = 0,
+        only_metadata: bool = False,
+        only_summary: bool = False,
+        prefetch: int = 1,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield every memory, walking all cursors.
+
+        A background thread fetches up to ``prefetch`` pages ahead while the
+        current page is decrypted and consumed, so network and CPU overlap.
+        At most ``prefetch + 2`` pages are held at once (the queued pages,
+        the page being consumed and one the prefetcher has fetched while it
+        waits for a free slot), however many memories the handle has. Pages
+        bypass the page cache.
+
+        Parameters are as for :meth:`get_memories`; ``limit`` is the page size.
+        """
+        pages: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, prefetch))
+        stop = threading.Event()
+        done = object()
+
+        def put(item: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
                     continue
+            return False
+
+        def produce() -> None:
+            cursor = ""
+            try:
+                while True:
+                    memories, cursor, _ = self._fetch_page(
+                        handle, limit, cursor, only_metadata, only_summary)
+                    if not put(memories) or not cursor or not memories:
+                        break
+            except Exception as e:
+                put(e)
+                return
+            put(done)
+
+        producer = threading.Thread(target=produce, name="memo-prefetch", daemon=True)
+        producer.start()
+        try:
+            while True:
+                page = pages.get()
+                if page is done:
+                    return
+                if isinstance(page, Exception):
+                    raise page
+                if not only_metadata and not only_summary:
+                    self._decrypt_memories(page)
+                yield from page
+        finally:
+            stop.set()
+
+    def close(self) -> None:
+        self.session.close()
+        self._shutdown()
+
+
+class AsyncMemoClient(_MemoBase):
+    """
+    asyncio client for yomemoai API, for use inside the MCP event loop.
+
+    Uses a pooled ``httpx.AsyncClient`` so concurrent tool calls share
+    keep-alive connections, and runs RSA/AES work in a worker thread so a
+    large page never stalls the loop. Envelope format is identical to
+    :class:`MemoClient`.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        private_key_pem: str,
+        base_url: str,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        timeout: float = 30.0,
+        connect_timeout: float = 5.0,
+        keepalive_expiry: float = 5.0,
+        decrypt_workers: int = 1,
+        key_cache_size: int = 1024,
+        key_cache_ttl: float = 3600.0,
+        page_cache_size: int = 64,
+        page_cache_ttl: float = 120.0,
+        batch_concurrency: int = 4,
+        envelope_version: int = 1,
+        key_scheme: str = "rsa",
+        compression: str = "none",
+        compression_min_size: int = 1024,
+        retry: Optional[RetryPolicy] = None,
+        search_index: Optional[SearchIndex] = None,
+        sync_store: Optional[SyncStore] = None,
+        prefetch_max_bytes: int = 16 * 1024 * 1024,
+        prefetch_ttl: float = 60.0,
+    ):
+        super().__init__(
+            api_key, private_key_pem, base_url,
+            decrypt_workers=decrypt_workers,
+            key_cache_size=key_cache_size,
+            key_cache_ttl=key_cache_ttl,
+            page_cache_size=page_cache_size,
+            page_cache_ttl=page_cache_ttl,
+            batch_concurrency=batch_concurrency,
+            envelope_version=envelope_version,
+            key_scheme=key_scheme,
+            compression=compression,
+            compression_min_size=compression_min_size,
+            retry=retry,
+            search_index=search_index,
+            sync_store=sync_store,
+        )
+        self.prefetch_cache = PrefetchCache(max_bytes=prefetch_max_bytes, ttl=prefetch_ttl)
+        self._prefetching: Dict[Tuple[str, int, str], asyncio.Task] = {}
+        self.http = httpx.AsyncClient(
+            headers=self._headers,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(timeout, connect=connect_timeout),
+        )
+
+    async def _request(self, method: str, url: str, idempotent: bool, **kwargs: Any) -> httpx.Response:
+        """Send a request, retrying per ``self.retry``; see :class:`RetryPolicy`."""
+        attempt = 0
+        while True:
+            try:
+                with metrics.span("http", method=method):
+                    resp = await self.http.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                # Connect failures mean the request never reached the server.
+                safe = idempotent or isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))
+                if not self.retry.should_retry(attempt, safe):
+                    raise
+                delay = self.retry.delay(attempt)
+                reason = f"{type(e).__name__}: {e}"
+            else:
+                self._count_bytes(resp.request.content, resp.content)
+                if not self.retry.should_retry(attempt, idempotent, resp.status_code):
+                    return resp
+                delay = self.retry.delay(attempt, resp.headers.get("Retry-After"))
+                reason = f"HTTP {resp.status_code}"
+                await resp.aclose()
+            attempt += 1
+            logger.warning("Retrying %s %s in %.2fs (%s/%s) after %s",
+                           method, url, delay, attempt, self.retry.max_retries, reason)
+            await asyncio.sleep(delay)
+
+    async def add_memory(
+        self,
+        content: str,
+        handle: str = "",
+        description: str = "",
+        metadata: Dict = None,
+        idempotent_key: str = "",
+    ):
+        payload = await self.prepare_memory(
+            content, handle, description, metadata, idempotent_key)
+        return await self.post_memory(payload, content)
+
+    async def prepare_memory(
+        self,
+        content: str,
+        handle: str = "",
+        description: str = "",
+        metadata: Dict = None,
+        idempotent_key: str = "",
+    ) -> Dict[str, Any]:
+        """Build the encrypted, signed request body for a save without sending it."""
+        payload = self._build_memory_payload(
+            content, handle, description, metadata, idempotent_key)
+        packed = await asyncio.to_thread(self.pack_data, content.encode('utf-8'))
+        return self._finish_memory_payload(payload, packed)
+
+    async def post_memory(self, payload: Dict[str, Any], content: Optional[str] = None):
+        """
+        POST a body from :meth:`prepare_memory`.
+
+        ``content`` is the plaintext, used only to update the local search
+        index; pass None when it is not at hand (e.g. replaying a queue).
+        """
+        url = f"{self.base_url}/api/v1/memory"
+        logger.debug(f"POST {url}")
+
+        try:
+            resp = await self._request(
+                "POST", url, idempotent="idempotent_key" in payload, json=payload)
+            logger.debug(f"Response status: {resp.status_code}")
+
+            if not resp.is_success:
                 try:
-                    decrypted = self.unpack_and_decrypt(content)
-                    m["content"] = decrypted.decode("utf-8")
+                    body = resp.json()
+                except Exception:
+                    body = None
+                self._raise_for_api_error(url, payload, resp.status_code, resp.text, body)
+
+            result = resp.json()
+            self._log_add_response(result)
+            await self._on_saved(payload, content, result)
+            return result
+        except httpx.HTTPError as e:
+            logger.error(f"Request failed: {type(e).__name__}: {str(e)}")
+            raise MemoRequestError(
+                f"Request failed: {type(e).__name__}: {str(e)}",
+                url=url,
+                payload=payload,
+            ) from e
+        except MemoRequestError:
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error: {type(e).__name__}: {str(e)}")
+            raise
+
+    async def add_memories(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Save several memories concurrently.
+
+        See :meth:`MemoClient.add_memories` for the item and result format.
+        """
+        semaphore = asyncio.Semaphore(self.batch_concurrency)
+
+        async def save(index: int, item: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return self._batch_result(index, await self.add_memory(**item))
                 except Exception as e:
-                    logger.warning("Decryption failed for %s: %s", m.get("id"), e)
-                    m["content"] = "(decryption failed)"
+                    logger.warning("add_memories item %s failed: %s", index, e)
+                    return self._batch_result(index, error=e)
+
+        return list(await asyncio.gather(*(save(i, item) for i, item in enumerate(items))))
+
+    async def _fetch_page(
+        self,
+        handle: Optional[str],
+        limit: int,
+        cursor: str,
+        only_metadata: bool,
+        only_summary: bool,
+    ) -> Tuple[List[Dict[str, Any]], str, int]:
+        """GET one page as the server returns it (content still encrypted)."""
+        url = f"{self.base_url}/api/v1/memory"
+        params = self._memory_query(handle, limit, cursor, only_metadata, only_summary)
+
+        resp = await self._request("GET", url, idempotent=True, params=params)
+        resp.raise_for_status()
+        with metrics.span("json_decode"):
+            body = resp.json()
+        return self._parse_memories_body(body)
+
+    async def get_memories(
+        self,
+        handle: Optional[str] = None,
+        limit: int = 0,
+        cursor: str = "",
+        only_metadata: bool = False,
+        only_summary: bool = False,
+        decrypt: bool = True,
+    ) -> Tuple[List[Dict[str, Any]], str, int]:
+        """
+        Fetch memories with optional pagination and lightweight modes.
+
+        See :meth:`MemoClient.get_memories` for parameters and return value.
+        """
+        page_key = self._page_key(handle, limit, cursor, only_metadata, only_summary)
+        cached = self.page_cache.get(*page_key)
+        if cached is not None:
+            memories, next_cursor, total = cached
+        else:
+            memories, next_cursor, total = await self._fetch_page(
+                handle, limit, cursor, only_metadata, only_summary)
+            self.page_cache.put(*page_key, memories, next_cursor, total)
+
+        # Decrypt content only when we requested full content (no lightweight mode).
+        if decrypt and not only_metadata and not only_summary:
+            await asyncio.to_thread(self._decrypt_memories, memories)
 
         return memories, next_cursor, total
+
+    async def decrypt_memories(self, memories: List[Dict[str, Any]]) -> None:
+        """Decrypt ``content`` in place (in a worker thread) for memories fetched with ``decrypt=False``."""
+        await asyncio.to_thread(self._decrypt_memories, memories)
+
+    def prefetch(
+        self, handle: Optional[str] = None, limit: int = 20, cursor: str = "", next_cursor: str = ""
+    ) -> None:
+        """
+        Fetch and decrypt the full page for ``cursor`` in the background.
+
+        Meant to be called right after serving the summary page for the same
+        cursor, since the full page is usually requested next; collect it
+        with :meth:`prefetched`. With ``next_cursor`` the following summary
+        page is then fetched into the page cache as well. Plaintext is kept
+        within ``prefetch_cache.max_bytes``. Does nothing when the page is
+        already prefetched or in flight, or the prefetch cache is disabled.
+        """
+        key = (handle or "", limit, cursor)
+        if not self.prefetch_cache.enabled or key in self._prefetching or key in self.prefetch_cache:
+            return
+        task = asyncio.create_task(self._prefetch(key, handle, limit, cursor, next_cursor))
+        self._prefetching[key] = task
+        # A callback rather than ``finally``: it also runs for a task cancelled before it started.
+        task.add_done_callback(lambda _: self._prefetching.pop(key, None))
+
+    async def prefetched(
+        self, handle: Optional[str], limit: int, cursor: str
+    ) -> Optional[Tuple[List[Dict[str, Any]], str, int, int]]:
+        """
+        Return the page prepared by :meth:`prefetch`, waiting for it if still in flight.
+
+        :return: ``(memories, next_cursor, total, ready)`` or None. The first
+            ``ready`` memories are decrypted; the rest still hold ciphertext
+            (pass them to :meth:`decrypt_memories`).
+        """
+        if not self.prefetch_cache.enabled:
+            return None
+        key = (handle or "", limit, cursor)
+        task = self._prefetching.get(key)
+        if task is not None:
+            # wait() neither raises if the prefetch fails nor cancels it if we are cancelled.
+            await asyncio.wait([task])
+        return self.prefetch_cache.get(*key)
+
+    async def _prefetch(
+        self,
+        key: Tuple[str, int, str],
+        handle: Optional[str],
+        limit: int,
+        cursor: str,
+        next_cursor: str,
+    ) -> None:
+        generation = self.prefetch_cache.generation
+        try:
+            with metrics.span("prefetch"):
+                memories, page_cursor, total = await self.get_memories(
+                    handle=handle, limit=limit, cursor=cursor, decrypt=False)
+                ready, size = await self._decrypt_within(memories, self.prefetch_cache.max_bytes)
+            self.prefetch_cache.put(*key, memories, page_cursor, total, ready, size, generation)
+            if next_cursor and self.page_cache.enabled:
+                await self.get_memories(
+                    handle=handle, limit=limit, cursor=next_cursor, only_summary=True, decrypt=False)
+        except Exception as e:
+            logger.debug("Prefetch of %s failed: %s", key, e)
+
+    async def _decrypt_within(self, memories: List[Dict[str, Any]], max_bytes: int) -> Tuple[int, int]:
+        """
+        Decrypt leading memories in place while the page's strings fit ``max_bytes``.
+
+        Returns ``(ready, size)``: how many leading memories were decrypted
+        and the page's string footprint (``sys.getsizeof``) afterwards.
+        """
+        def footprint(m: Dict[str, Any]) -> int:
+            return sum(sys.getsizeof(v) for v in m.values() if isinstance(v, str))
+
+        size = sum(footprint(m) for m in memories)
+        ready = 0
+        while ready < len(memories):
+            chunk = memories[ready:ready + self.decrypt_workers]
+            before = [(m.get("content"), footprint(m)) for m in chunk]
+            await self.decrypt_memories(chunk)
+            for i, m in enumerate(chunk):
+                grown = footprint(m) - before[i][1]
+                if size + grown > max_bytes:
+                    # Over budget: restore the ciphertext so it is decrypted on demand instead.
+                    for rest, (content, _) in zip(chunk[i:], before[i:]):
+                        rest["content"] = content
+                    return ready, size
+                size += grown
+                ready += 1
+        return ready, size
+
+    async def find_memory(
+        self, memory_id: str, handle: Optional[str] = None, limit: int = 100
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return one memory with decrypted content, or None if it does not exist.
+
+        See :meth:`MemoClient.find_memory`.
+        """
+        memory = self._cached_full_item(memory_id)
+        cursor = ""
+        try:
+            while memory is None:
+                page_cursor = cursor
+                page, cursor, _ = await self._fetch_page(handle, limit, cursor, True, False)
+                if self._pick(page, memory_id) is not None:
+                    page, _, _ = await self.get_memories(handle, limit, page_cursor, decrypt=False)
+                    memory = self._pick(page, memory_id)
+                    if memory is None:
+                        return None  # deleted between the two requests
+                elif not cursor or not page:
+                    return None
+        except (MemoRequestError, httpx.HTTPError) as e:
+            stored = None
+            if self.sync_store is not None:
+                stored = await asyncio.to_thread(self.sync_store.get, memory_id)
+            if stored is None:
+                raise
+            logger.warning("find_memory: API unavailable (%s); returning the local copy", e)
+            return stored
+        await asyncio.to_thread(self._decrypt_memories, [memory])
+        return memory
+
+    async def sync(
+        self, handle: Optional[str] = None, since: Optional[str] = None, limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """
+        Pull new and changed memories into ``sync_store``.
+
+        See :meth:`MemoClient.sync`.
+        """
+        full, cutoff = self._sync_start(since)
+        newest = await asyncio.to_thread(self.sync_store.watermark, handle)
+        wanted: List[Tuple[str, List[str]]] = []
+        cursor = ""
+        while True:
+            page_cursor = cursor
+            page, cursor, _ = await self._fetch_page(handle, limit, cursor, True, False)
+            ids = await asyncio.to_thread(self._sync_select, page, full, cutoff)
+            if ids:
+                wanted.append((page_cursor, ids))
+            newest = max([newest] + [change_stamp(m) for m in page])
+            if not cursor or not page:
+                break
+        changed: List[Dict[str, Any]] = []
+        for page_cursor, ids in wanted:
+            page, _, _ = await self._fetch_page(handle, limit, page_cursor, False, False)
+            fresh = [m for m in page if str(m.get("id")) in ids]
+            ok = await asyncio.to_thread(self._decrypt_memories, fresh)
+            changed.extend(m for m, decrypted in zip(fresh, ok) if decrypted)
+        await asyncio.to_thread(self.sync_store.merge, handle, changed, newest)
+        logger.info("sync: handle=%s changed=%s watermark=%s", handle or "(all)", len(changed), newest)
+        return changed
+
+    async def iter_memories(
+        self,
+        handle: Optional[str] = None,
+        limit: int = 0,
+        only_metadata: bool = False,
+        only_summary: bool = False,
+        prefetch: int = 1,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Lazily yield every memory, walking all cursors.
+
+        See :meth:`MemoClient.iter_memories`, including the ``prefetch + 2``
+        page bound; the prefetcher here is an asyncio task and decryption
+        runs in a worker thread.
+        """
+        pages: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=max(1, prefetch))
+        done = object()
+
+        async def produce() -> None:
+            cursor = ""
+            try:
+                while True:
+                    memories, cursor, _ = await self._fetch_page(
+                        handle, limit, cursor, only_metadata, only_summary)
+                    await pages.put(memories)
+                    if not cursor or not memories:
+                        break
+            except Exception as e:
+                await pages.put(e)
+                return
+            await pages.put(done)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while True:
+                page = await pages.get()
+                if page is done:
+                    return
+                if isinstance(page, Exception):
+                    raise page
+                if not only_metadata and not only_summary:
+                    await asyncio.to_thread(self._decrypt_memories, page)
+                for m in page:
+                    yield m
+        finally:
+            producer.cancel()
+
+    async def _on_saved(self, payload: Dict[str, Any], content: Optional[str], result: Dict) -> None:
+        """Like :meth:`_MemoBase._on_saved`, with the index and store writes off the event loop."""
+        self._invalidate_saved(payload)
+        if self.search_index is not None or self.sync_store is not None:
+            await asyncio.to_thread(self._store_saved, payload, content, result)
+
+    def _invalidate_saved(self, payload: Dict[str, Any]) -> None:
+        super()._invalidate_saved(payload)
+        self.prefetch_cache.invalidate_handle(payload["handle"])
+
+    def _shutdown(self) -> None:
+        for task in self._prefetching.values():
+            task.cancel()
+        self._prefetching.clear()
+        self.prefetch_cache.clear()
+        super()._shutdown()
+
+    async def aclose(self) -> None:
+        await self.http.aclose()
+        self._shutdown()
+
+    async def __aenter__(self) -> "AsyncMemoClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
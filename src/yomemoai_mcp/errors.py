@@ -0,0 +1,17 @@
+from typing import Dict, Optional
+
+
+class MemoRequestError(Exception):
+    def __init__(
+        self,
+        message: str,
+        url: str,
+        payload: Dict,
+        status_code: Optional[int] = None,
+        response_text: Optional[str] = None,
+    ):
+        super().__init__(message)
+        self.url = url
+        self.payload = payload
+        self.status_code = status_code
+        self.response_text = response_text
@@ -0,0 +1,195 @@
+import functools
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+# Hook signature: (span name, duration in seconds, attributes).
+SpanHook = Callable[[str, float, Dict[str, Any]], None]
+
+
+class _NoopSpan:
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+
+_NOOP = _NoopSpan()
+
+
+class _Span:
+    __slots__ = ("_metrics", "_name", "_attrs", "_start")
+
+    def __init__(self, metrics: "Metrics", name: str, attrs: Dict[str, Any]):
+        self._metrics = metrics
+        self._name = name
+        self._attrs = attrs
+
+    def __enter__(self) -> "_Span":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type: Any, *exc_info: Any) -> None:
+        if exc_type is not None:
+            self._attrs["error"] = exc_type.__name__
+        self._metrics.record(self._name, time.perf_counter() - self._start, self._attrs)
+
+
+class Metrics:
+    """
+    Timing spans and counters for the client and tools.
+
+    Disabled by default: ``span()`` then returns a shared no-op context
+    manager and ``incr()`` returns immediately, so instrumented hot paths
+    cost one attribute check. When enabled, every span is aggregated
+    (count/sum/max per name) and passed to registered hooks, e.g.
+    :func:`opentelemetry_hook` or a plain callback.
+
+    Collectors are callables returning ``{name: value}`` gauges (cache
+    sizes, hit counts) read on each snapshot.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._spans: Dict[str, List[float]] = {}
+        self._counters: Dict[str, float] = {}
+        self._hooks: List[SpanHook] = []
+        self._collectors: List[Callable[[], Dict[str, float]]] = []
+
+    def span(self, name: str, **attrs: Any):
+        if not self.enabled:
+            return _NOOP
+        return _Span(self, name, attrs)
+
+    def timed(self, name: str, **attrs: Any):
+        """Decorator timing each call of an async function as span ``name``."""
+        def decorator(fn):
+            @functools.wraps(fn)
+            async def wrapper(*args: Any, **kwargs: Any):
+                with self.span(name, **attrs):
+                    return await fn(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def incr(self, name: str, value: float = 1) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def record(self, name: str, duration: float, attrs: Optional[Dict[str, Any]] = None) -> None:
+        with self._lock:
+            agg = self._spans.get(name)
+            if agg is None:
+                self._spans[name] = [1, duration, duration]
+            else:
+                agg[0] += 1
+                agg[1] += duration
+                if duration > agg[2]:
+                    agg[2] = duration
+        for hook in self._hooks:
+            try:
+                hook(name, duration, attrs or {})
+            except Exception as e:
+                logger.debug("metrics hook failed: %s", e)
+
+    def add_hook(self, hook: SpanHook) -> None:
+        self._hooks.append(hook)
+
+    def add_collector(self, collector: Callable[[], Dict[str, float]]) -> None:
+        self._collectors.append(collector)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            spans = {
+                name: {"count": int(c), "total_s": total, "avg_s": total / c, "max_s": peak}
+                for name, (c, total, peak) in self._spans.items()
+            }
+            counters = dict(self._counters)
+        gauges: Dict[str, float] = {}
+        for collector in self._collectors:
+            try:
+                gauges.update(collector())
+            except Exception as e:
+                logger.debug("metrics collector failed: %s", e)
+        return {"enabled": self.enabled, "spans": spans, "counters": counters, "gauges": gauges}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._spans.clear()
+            self._counters.clear()
+
+    def render_prometheus(self) -> str:
+        """Current values in the Prometheus text exposition format."""
+        snap = self.snapshot()
+        lines = [
+            "# TYPE yomemo_span_seconds summary",
+        ]
+        for name, s in sorted(snap["spans"].items()):
+            lines.append('yomemo_span_seconds_count{span="%s"} %d' % (name, s["count"]))
+            lines.append('yomemo_span_seconds_sum{span="%s"} %.9f' % (name, s["total_s"]))
+        lines.append("# TYPE yomemo_span_seconds_max gauge")
+        for name, s in sorted(snap["spans"].items()):
+            lines.append('yomemo_span_seconds_max{span="%s"} %.9f' % (name, s["max_s"]))
+        for name, value in sorted(snap["counters"].items()):
+            lines.append("# TYPE yomemo_%s_total counter" % name)
+            lines.append("yomemo_%s_total %s" % (name, value))
+        for name, value in sorted(snap["gauges"].items()):
+            lines.append("# TYPE yomemo_%s gauge" % name)
+            lines.append("yomemo_%s %s" % (name, value))
+        return "\n".join(lines) + "\n"
+
+    def serve_prometheus(self, port: int, host: str = "127.0.0.1") -> "ThreadingHTTPServer":
+        """Serve ``GET /metrics`` from a daemon thread; returns the server."""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render_prometheus().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                logger.debug("metrics endpoint: " + format, *args)
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, name="memo-metrics", daemon=True).start()
+        logger.info("Prometheus metrics on http://%s:%s/metrics", host, server.server_port)
+        return server
+
+
+def opentelemetry_hook() -> SpanHook:
+    """
+    Hook that records span durations on an OpenTelemetry histogram.
+
+    Needs ``opentelemetry-api``; the application configures the meter provider.
+    """
+    from opentelemetry import metrics as otel_metrics
+
+    histogram = otel_metrics.get_meter("yomemoai_mcp").create_histogram(
+        "yomemo.span.duration", unit="s", description="Duration of yomemoai_mcp operations")
+
+    def hook(name: str, duration: float, attrs: Dict[str, Any]) -> None:
+        histogram.record(duration, {"span": name, **{k: str(v) for k, v in attrs.items()}})
+
+    return hook
+
+
+# Process-wide registry used by the clients and the MCP tools.
+metrics = Metrics()
@@ -0,0 +1,243 @@
+import asyncio
+import json
+import logging
+import random
+import threading
+import time
+import uuid
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from .errors import MemoRequestError
+from .storage import open_db
+
+if TYPE_CHECKING:
+    from .client import AsyncMemoClient
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id TEXT PRIMARY KEY,
+    handle TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt REAL NOT NULL DEFAULT 0,
+    last_error TEXT,
+    created_at REAL NOT NULL
+)
+"""
+
+# Pending entries with no older pending entry for the same idempotent_key.
+# Saves to one key are sent one at a time, oldest first, so a retried older
+# save can never land after a newer one.
+_HEADS = """
+FROM outbox o WHERE o.state = 'pending' AND NOT EXISTS (
+    SELECT 1 FROM outbox p WHERE p.state = 'pending'
+    AND json_extract(p.payload, '$.idempotent_key') = json_extract(o.payload, '$.idempotent_key')
+    AND (p.created_at < o.created_at OR (p.created_at = o.created_at AND p.rowid < o.rowid))
+)
+"""
+
+
+class Outbox:
+    """
+    Durable write-ahead queue of save requests (SQLite, append then delete).
+
+    Entries hold the request body exactly as it will be POSTed, so content
+    is already encrypted by ``pack_data``. Every entry carries an
+    ``idempotent_key`` (generated when the caller gave none), so replaying
+    an entry after a crash or a lost response updates the same memory
+    instead of creating a duplicate. Entries sharing a key are sent one at
+    a time in the order they were queued, so the newest content wins.
+
+    Entries the API rejects outright (4xx other than 429) are kept with
+    state ``failed`` rather than dropped, so no memory is silently lost.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = open_db(path)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=FULL")
+            self._conn.execute(_SCHEMA)
+
+    def enqueue(self, payload: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """Persist a prepared request body; returns ``(provisional_id, payload)``."""
+        payload = dict(payload)
+        if not payload.get("idempotent_key"):
+            payload["idempotent_key"] = uuid.uuid4().hex
+        provisional_id = "pending-" + uuid.uuid4().hex[:12]
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO outbox (id, handle, payload, created_at) VALUES (?, ?, ?, ?)",
+                (provisional_id, payload["handle"], json.dumps(payload), time.time()),
+            )
+        return provisional_id, payload
+
+    def due(self, limit: int) -> List[Tuple[str, int, Dict[str, Any]]]:
+        """
+        Pending entries whose backoff has elapsed: ``(id, attempts, payload)``, oldest first.
+
+        An entry waits while an older entry for the same ``idempotent_key``
+        is still pending, including one that is backing off.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT o.id, o.attempts, o.payload " + _HEADS
+                + "AND o.next_attempt <= ? ORDER BY o.created_at, o.rowid LIMIT ?",
+                (time.time(), limit),
+            ).fetchall()
+        return [(r[0], r[1], json.loads(r[2])) for r in rows]
+
+    def next_due_in(self) -> Optional[float]:
+        """Seconds until the next pending entry is due, or None when nothing is pending."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT min(o.next_attempt) " + _HEADS).fetchone()
+        if row[0] is None:
+            return None
+        return max(0.0, row[0] - time.time())
+
+    def done(self, entry_id: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM outbox WHERE id = ?", (entry_id,))
+
+    def retry_later(self, entry_id: str, delay: float, error: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE outbox SET attempts = attempts + 1, next_attempt = ?, last_error = ? WHERE id = ?",
+                (time.time() + delay, error, entry_id),
+            )
+
+    def fail(self, entry_id: str, error: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE outbox SET state = 'failed', attempts = attempts + 1, last_error = ? WHERE id = ?",
+                (error, entry_id),
+            )
+
+    def failed(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """Entries the API rejected, oldest first, with the error it returned."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, payload, last_error FROM outbox WHERE state = 'failed' "
+                "ORDER BY created_at LIMIT ?", (limit,),
+            ).fetchall()
+        return [_failure(entry_id, json.loads(payload), error) for entry_id, payload, error in rows]
+
+    def requeue(self, entry_ids: List[str]) -> int:
+        """Move failed entries back to pending so they are sent again; returns how many moved."""
+        marks = ",".join("?" * len(entry_ids))
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                "UPDATE outbox SET state = 'pending', attempts = 0, next_attempt = 0 "
+                f"WHERE state = 'failed' AND id IN ({marks})", list(entry_ids))
+        return cur.rowcount
+
+    def discard(self, entry_ids: List[str]) -> int:
+        """Delete failed entries for good; returns how many were deleted."""
+        marks = ",".join("?" * len(entry_ids))
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                f"DELETE FROM outbox WHERE state = 'failed' AND id IN ({marks})", list(entry_ids))
+        return cur.rowcount
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT state, count(*) FROM outbox GROUP BY state").fetchall()
+        counts = {"pending": 0, "failed": 0}
+        counts.update(dict(rows))
+        return counts
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _failure(entry_id: str, payload: Dict[str, Any], error: Optional[str]) -> Dict[str, Any]:
+    return {
+        "id": entry_id,
+        "handle": payload.get("handle", ""),
+        "description": payload.get("description", ""),
+        "idempotent_key": payload.get("idempotent_key", ""),
+        "error": error or "",
+    }
+
+
+class OutboxFlusher:
+    """
+    Background asyncio task that uploads queued saves.
+
+    Sends up to ``batch_size`` due entries concurrently, backs off
+    failed entries per the client's retry policy (never giving up on
+    transient errors), and exits once the queue is empty. Call
+    :meth:`wake` after enqueueing to (re)start it.
+
+    Entries it gives up on are also collected in ``rejected`` until
+    :meth:`take_rejected` hands them over to be reported to the user.
+    """
+
+    def __init__(self, client: "AsyncMemoClient", outbox: Outbox, batch_size: int = 8,
+                 max_backoff: float = 300.0):
+        self.client = client
+        self.outbox = outbox
+        self.batch_size = batch_size
+        self.max_backoff = max_backoff
+        self._task: Optional[asyncio.Task] = None
+        self.rejected: List[Dict[str, Any]] = []
+
+    def wake(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def take_rejected(self) -> List[Dict[str, Any]]:
+        """Return and forget the entries rejected since the last call."""
+        rejected, self.rejected = self.rejected, []
+        return rejected
+
+    async def _run(self) -> None:
+        while True:
+            batch = await asyncio.to_thread(self.outbox.due, self.batch_size)
+            if batch:
+                await asyncio.gather(*(self._send(*entry) for entry in batch))
+                continue
+            wait = await asyncio.to_thread(self.outbox.next_due_in)
+            if wait is None:
+                return
+            await asyncio.sleep(wait)
+
+    async def _send(self, entry_id: str, attempts: int, payload: Dict[str, Any]) -> None:
+        from .client import memory_ref
+
+        index = self.client.search_index
+        try:
+            result = await self.client.post_memory(payload)
+        except MemoRequestError as e:
+            permanent = e.status_code is not None and 400 <= e.status_code < 500 and e.status_code != 429
+            if permanent:
+                logger.error("Queued save %s rejected, keeping it as failed: %s", entry_id, e)
+                await self._reject(entry_id, payload, str(e))
+                return
+            delay = min(self.max_backoff, 2 ** attempts) * random.uniform(0.5, 1.0)
+            logger.warning("Queued save %s failed, retrying in %.0fs: %s", entry_id, delay, e)
+            await asyncio.to_thread(self.outbox.retry_later, entry_id, delay, str(e))
+        except Exception as e:
+            logger.error("Queued save %s failed unexpectedly, keeping it as failed: %s", entry_id, e)
+            await self._reject(entry_id, payload, str(e))
+        else:
+            logger.info("Queued save %s uploaded", entry_id)
+            await asyncio.to_thread(self.outbox.done, entry_id)
+            memory_id, _ = memory_ref(result)
+            if index is not None and memory_id:
+                # _queue_save indexed the plaintext under the provisional id.
+                await asyncio.to_thread(index.rename, entry_id, memory_id)
+
+    async def _reject(self, entry_id: str, payload: Dict[str, Any], error: str) -> None:
+        await asyncio.to_thread(self.outbox.fail, entry_id, error)
+        if self.client.search_index is not None:
+            await asyncio.to_thread(self.client.search_index.remove, entry_id)
+        self.rejected.append(_failure(entry_id, payload, error))
@@ -0,0 +1,61 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional
+
+# Statuses worth retrying: rate limiting and transient gateway/server errors.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class RetryPolicy:
+    """
+    When and how long to wait before retrying an API request.
+
+    Only idempotent requests are retried on a response or read failure:
+    GETs, and POSTs that carry an ``idempotent_key`` (the server updates the
+    same memory instead of creating a duplicate). Failures to connect are
+    retried for every request, since nothing reached the server.
+
+    Delays use exponential backoff with full jitter, capped at
+    ``backoff_max``; a ``Retry-After`` header takes precedence, capped at
+    ``retry_after_max``.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        retry_after_max: float = 60.0,
+        retry_statuses: Iterable[int] = RETRY_STATUSES,
+    ):
+        self.max_retries = max(0, max_retries)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_after_max = retry_after_max
+        self.retry_statuses = frozenset(retry_statuses)
+
+    def should_retry(self, attempt: int, idempotent: bool, status_code: Optional[int] = None) -> bool:
+        """``attempt`` is the number of retries already made."""
+        if attempt >= self.max_retries or not idempotent:
+            return False
+        return status_code is None or status_code in self.retry_statuses
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        if retry_after:
+            seconds = self._parse_retry_after(retry_after)
+            if seconds is not None:
+                return min(seconds, self.retry_after_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    @staticmethod
+    def _parse_retry_after(value: str) -> Optional[float]:
+        value = value.strip()
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
@@ -0,0 +1,126 @@
+import logging
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from .storage import open_db
+
+logger = logging.getLogger(__name__)
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS memories USING fts5(
+    memory_id UNINDEXED,
+    handle UNINDEXED,
+    idempotent_key UNINDEXED,
+    created_at UNINDEXED,
+    description,
+    content,
+    tokenize = 'unicode61 remove_diacritics 2'
+)
+"""
+
+
+class SearchIndex:
+    """
+    On-device full-text index over decrypted memories (SQLite FTS5).
+
+    Content is end-to-end encrypted, so the API cannot search it. The index
+    is filled as memories are decrypted by ``get_memories`` / ``iter_memories``
+    and when they are saved, and answers ranked (BM25) queries locally.
+    It holds plaintext: keep it in memory (the default) or in a file only
+    on a trusted device.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = open_db(path)
+        with self._lock, self._conn:
+            self._conn.execute(_SCHEMA)
+
+    def upsert(self, memories: Iterable[Dict[str, Any]]) -> int:
+        """Index memories that carry an ``id`` and decrypted ``content``; returns how many."""
+        rows = [
+            (
+                str(m["id"]),
+                m.get("handle") or "",
+                m.get("idempotent_key") or "",
+                m.get("created_at") or "",
+                m.get("description") or "",
+                m["content"],
+            )
+            for m in memories
+            if m.get("id") is not None and m.get("content")
+        ]
+        if not rows:
+            return 0
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM memories WHERE memory_id = ?", [(r[0],) for r in rows])
+            self._conn.executemany(
+                "INSERT INTO memories (memory_id, handle, idempotent_key, created_at, description, content) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def search(self, query: str, handle: Optional[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Rank indexed memories against ``query``.
+
+        The query is treated as plain words (FTS syntax is not interpreted);
+        memories matching more of them, and rarer ones, rank higher.
+        """
+        tokens = _TOKEN.findall(query)
+        if not tokens:
+            return []
+        match = " OR ".join('"%s"' % t for t in tokens)
+        sql = (
+            "SELECT memory_id, handle, idempotent_key, created_at, description, "
+            "snippet(memories, 5, '[', ']', '...', 16), bm25(memories) "
+            "FROM memories WHERE memories MATCH ?"
+        )
+        params: List[Any] = [match]
+        if handle:
+            sql += " AND handle = ?"
+            params.append(handle)
+        sql += " ORDER BY bm25(memories) LIMIT ?"
+        params.append(max(1, limit))
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [
+            {
+                "id": r[0],
+                "handle": r[1],
+                "idempotent_key": r[2],
+                "created_at": r[3],
+                "description": r[4],
+                "snippet": r[5],
+                "score": -r[6],
+            }
+            for r in rows
+        ]
+
+    def rename(self, old_id: str, new_id: str) -> None:
+        """Move an entry indexed under a provisional id (a queued save) to its real id."""
+        with self._lock, self._conn:
+            if self._conn.execute(
+                    "SELECT 1 FROM memories WHERE memory_id = ?", (str(old_id),)).fetchone() is None:
+                return
+            self._conn.execute("DELETE FROM memories WHERE memory_id = ?", (str(new_id),))
+            self._conn.execute(
+                "UPDATE memories SET memory_id = ? WHERE memory_id = ?", (str(new_id), str(old_id)))
+
+    def remove(self, memory_id: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM memories WHERE memory_id = ?", (str(memory_id),))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT count(*) FROM memories").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -1,18 +1,31 @@
 import asyncio
+import atexit
+import base64
+import functools
 import json
 import logging
 import os
 import sys
-from typing import Optional
-
-from mcp.server.fastmcp import FastMCP
-from .client import MemoClient, MemoRequestError
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Optional
 
 if "--version" in sys.argv or "-version" in sys.argv:
     from importlib.metadata import version
     print(version("yomemoai-mcp"))
     sys.exit(0)
 
+from mcp.server.fastmcp import Context, FastMCP
+from .errors import MemoRequestError
+from .metrics import metrics
+
+# The API client (cryptography, httpx, requests) and the private key are
+# loaded on first tool use, so the MCP initialize handshake is answered
+# without paying for them.
+if TYPE_CHECKING:
+    from .client import AsyncMemoClient
+    from .outbox import OutboxFlusher
+    from .tenants import TenantPool
+
 from dotenv import load_dotenv
 load_dotenv()
 
@@ -40,31 +53,277 @@ if DEBUG:
     logging.getLogger("yomemoai_mcp").addHandler(_file_handler)
 
 
-mcp = FastMCP("yomemoai")
+TRANSPORT = os.getenv("MEMO_TRANSPORT", "stdio").lower()
+HOST = os.getenv("MEMO_HOST", "127.0.0.1")
+PORT = int(os.getenv("MEMO_PORT", "8000"))
+
+mcp = FastMCP("yomemoai", host=HOST, port=PORT)
 
 API_KEY = os.getenv("MEMO_API_KEY", "")
 PRIV_KEY_PATH = os.getenv("MEMO_PRIVATE_KEY_PATH", "private.pem")
 BASE_URL = os.getenv("MEMO_BASE_URL", "https://api.yomemo.ai")
+MAX_CONNECTIONS = int(os.getenv("MEMO_MAX_CONNECTIONS", "10"))
+MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("MEMO_MAX_KEEPALIVE_CONNECTIONS", "5"))
+TIMEOUT = float(os.getenv("MEMO_TIMEOUT", "30"))
+CONNECT_TIMEOUT = float(os.getenv("MEMO_CONNECT_TIMEOUT", "5"))
+KEEPALIVE_EXPIRY = float(os.getenv("MEMO_KEEPALIVE_EXPIRY", "5"))
+MAX_RETRIES = int(os.getenv("MEMO_MAX_RETRIES", "3"))
+BACKOFF_BASE = float(os.getenv("MEMO_BACKOFF_BASE", "0.5"))
+BACKOFF_MAX = float(os.getenv("MEMO_BACKOFF_MAX", "8"))
+SEARCH_INDEX = os.getenv("MEMO_SEARCH_INDEX", "true").lower() == "true"
+SEARCH_INDEX_PATH = os.getenv("MEMO_SEARCH_INDEX_PATH", ":memory:")
+WRITE_QUEUE = os.getenv("MEMO_WRITE_QUEUE", "false").lower() == "true"
+WRITE_QUEUE_PATH = os.getenv("MEMO_WRITE_QUEUE_PATH", "~/.yomemo/outbox.db")
+WRITE_QUEUE_BATCH = int(os.getenv("MEMO_WRITE_QUEUE_BATCH", "8"))
+SYNC = os.getenv("MEMO_SYNC", "false").lower() == "true"
+SYNC_PATH = os.getenv("MEMO_SYNC_PATH", "~/.yomemo/sync.db")
+MULTI_TENANT = os.getenv("MEMO_MULTI_TENANT", "false").lower() == "true"
+TENANT_POOL_SIZE = int(os.getenv("MEMO_TENANT_POOL_SIZE", "64"))
+TENANT_IDLE_TTL = float(os.getenv("MEMO_TENANT_IDLE_TTL", "900"))
+METRICS = os.getenv("MEMO_METRICS", "false").lower() == "true"
+METRICS_PORT = int(os.getenv("MEMO_METRICS_PORT", "0"))
+METRICS_OTEL = os.getenv("MEMO_METRICS_OTEL", "false").lower() == "true"
+DECRYPT_WORKERS = int(os.getenv("MEMO_DECRYPT_WORKERS", str(min(4, os.cpu_count() or 1))))
+KEY_CACHE_SIZE = int(os.getenv("MEMO_KEY_CACHE_SIZE", "1024"))
+KEY_CACHE_TTL = float(os.getenv("MEMO_KEY_CACHE_TTL", "3600"))
+PAGE_CACHE_SIZE = int(os.getenv("MEMO_PAGE_CACHE_SIZE", "64"))
+PAGE_CACHE_TTL = float(os.getenv("MEMO_PAGE_CACHE_TTL", "120"))
+PREFETCH_MAX_BYTES = int(os.getenv("MEMO_PREFETCH_MAX_BYTES", str(16 * 1024 * 1024)))
+PREFETCH_TTL = float(os.getenv("MEMO_PREFETCH_TTL", "60"))
+PREFETCH_NEXT = os.getenv("MEMO_PREFETCH_NEXT", "false").lower() == "true"
+BATCH_CONCURRENCY = int(os.getenv("MEMO_BATCH_CONCURRENCY", "4"))
+ENVELOPE_VERSION = int(os.getenv("MEMO_ENVELOPE_VERSION", "1"))
+KEY_SCHEME = os.getenv("MEMO_KEY_SCHEME", "rsa").lower()
+COMPRESSION = os.getenv("MEMO_COMPRESSION", "none").lower()
+COMPRESSION_MIN_SIZE = int(os.getenv("MEMO_COMPRESSION_MIN_SIZE", "1024"))
+MAX_RESULT_CHARS = int(os.getenv("MEMO_MAX_RESULT_CHARS", "60000"))
+MAX_CONTENT_CHARS = int(os.getenv("MEMO_MAX_CONTENT_CHARS", "16000"))
+
+metrics.enabled = METRICS
+if METRICS and METRICS_PORT:
+    metrics.serve_prometheus(METRICS_PORT)
+if METRICS and METRICS_OTEL:
+    from .metrics import opentelemetry_hook
+    metrics.add_hook(opentelemetry_hook())
+
+_client: Optional["AsyncMemoClient"] = None
+_flusher: Optional["OutboxFlusher"] = None
+_tenants: Optional["TenantPool"] = None
+# Client of the tenant whose request is being served (multi-tenant mode only).
+_tenant_client: ContextVar[Optional["AsyncMemoClient"]] = ContextVar("tenant_client", default=None)
+
+
+def _build_client(api_key: str, private_pem: str, search_index=None, sync_store=None) -> "AsyncMemoClient":
+    from .client import AsyncMemoClient
+    from .retry import RetryPolicy
+
+    return AsyncMemoClient(
+        api_key,
+        private_pem,
+        BASE_URL,
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+        timeout=TIMEOUT,
+        connect_timeout=CONNECT_TIMEOUT,
+        keepalive_expiry=KEEPALIVE_EXPIRY,
+        decrypt_workers=DECRYPT_WORKERS,
+        key_cache_size=KEY_CACHE_SIZE,
+        key_cache_ttl=KEY_CACHE_TTL,
+        page_cache_size=PAGE_CACHE_SIZE,
+        page_cache_ttl=PAGE_CACHE_TTL,
+        batch_concurrency=BATCH_CONCURRENCY,
+        envelope_version=ENVELOPE_VERSION,
+        key_scheme=KEY_SCHEME,
+        compression=COMPRESSION,
+        compression_min_size=COMPRESSION_MIN_SIZE,
+        retry=RetryPolicy(
+            max_retries=MAX_RETRIES, backoff_base=BACKOFF_BASE, backoff_max=BACKOFF_MAX),
+        search_index=search_index,
+        sync_store=sync_store,
+        prefetch_max_bytes=PREFETCH_MAX_BYTES,
+        prefetch_ttl=PREFETCH_TTL,
+    )
 
-if not API_KEY:
-    raise ValueError("MEMO_API_KEY environment variable is required")
 
-if not os.path.exists(PRIV_KEY_PATH):
-    raise FileNotFoundError(
-        f"Private key file not found: {PRIV_KEY_PATH}. "
-        f"Please set MEMO_PRIVATE_KEY_PATH environment variable or place your private key at {PRIV_KEY_PATH}"
-    )
+def _build_tenant_client(api_key: str, private_pem: str) -> "AsyncMemoClient":
+    # Per-tenant state stays in memory: the write queue and sync store are single-user files.
+    from .search import SearchIndex
+
+    return _build_client(api_key, private_pem, SearchIndex() if SEARCH_INDEX else None)
 
-try:
-    with open(PRIV_KEY_PATH, "r") as f:
-        private_pem = f.read()
-except Exception as e:
-    raise IOError(f"Failed to read private key from {PRIV_KEY_PATH}: {e}")
 
-if not private_pem.strip():
-    raise ValueError(f"Private key file {PRIV_KEY_PATH} is empty")
+def get_client() -> "AsyncMemoClient":
+    """Return the shared client, reading the private key and building it on first call."""
+    global _client, _flusher
+    if MULTI_TENANT:
+        client = _tenant_client.get()
+        if client is None:
+            raise ValueError("No tenant credentials for this request")
+        return client
+    if _client is not None:
+        return _client
 
-client = MemoClient(API_KEY, private_pem, BASE_URL)
+    if not API_KEY:
+        raise ValueError("MEMO_API_KEY environment variable is required")
+
+    if not os.path.exists(PRIV_KEY_PATH):
+        raise FileNotFoundError(
+            f"Private key file not found: {PRIV_KEY_PATH}. "
+            f"Please set MEMO_PRIVATE_KEY_PATH environment variable or place your private key at {PRIV_KEY_PATH}"
+        )
+
+    try:
+        with open(PRIV_KEY_PATH, "r") as f:
+            private_pem = f.read()
+    except Exception as e:
+        raise IOError(f"Failed to read private key from {PRIV_KEY_PATH}: {e}")
+
+    if not private_pem.strip():
+        raise ValueError(f"Private key file {PRIV_KEY_PATH} is empty")
+
+    from .search import SearchIndex
+    from .sync_store import SyncStore
+
+    search_index = SearchIndex(SEARCH_INDEX_PATH) if SEARCH_INDEX else None
+    sync_store = SyncStore(SYNC_PATH) if SYNC else None
+    if search_index is not None and sync_store is not None:
+        # Make memories synced in earlier sessions searchable right away.
+        search_index.upsert(sync_store.iter_memories())
+
+    _client = _build_client(API_KEY, private_pem, search_index, sync_store)
+    # Zero cached AES keys on interpreter shutdown.
+    atexit.register(_client.key_cache.clear)
+    metrics.add_collector(_cache_gauges)
+
+    if WRITE_QUEUE:
+        from .outbox import Outbox, OutboxFlusher
+        outbox = Outbox(WRITE_QUEUE_PATH)
+        _flusher = OutboxFlusher(_client, outbox, batch_size=WRITE_QUEUE_BATCH)
+        # Saves rejected in an earlier run are reported once in this one too.
+        _flusher.rejected.extend(outbox.failed())
+        try:
+            # Upload anything left in the queue by a previous run.
+            _flusher.wake()
+        except RuntimeError:
+            pass  # No running loop yet; the next queued save starts the flusher.
+    return _client
+
+
+def _tenant_credentials(ctx: Optional[Context]) -> tuple:
+    """Read ``(api_key, private_pem)`` from the HTTP request behind a tool call."""
+    request = None
+    if ctx is not None:
+        try:
+            request = ctx.request_context.request
+        except ValueError:
+            pass
+    headers = getattr(request, "headers", None) or {}
+    api_key = headers.get("x-memo-api-key", "")
+    encoded = headers.get("x-memo-private-key", "")
+    if not api_key or not encoded:
+        raise ValueError(
+            "Multi-tenant mode needs X-Memo-API-Key and X-Memo-Private-Key (base64 PEM) request headers")
+    try:
+        private_pem = base64.b64decode(encoded, validate=True).decode()
+    except ValueError:
+        raise ValueError("X-Memo-Private-Key must be the base64-encoded PEM private key")
+    return api_key, private_pem
+
+
+def _per_tenant(fn):
+    """
+    Run a tool with the calling tenant's client in multi-tenant mode.
+
+    The tool must accept ``ctx: Optional[Context]``; credentials come from
+    its request headers and the client is leased from the tenant pool for
+    the duration of the call. Single-user mode calls the tool unchanged.
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        if not MULTI_TENANT:
+            return await fn(*args, **kwargs)
+        global _tenants
+        try:
+            api_key, private_pem = _tenant_credentials(kwargs.get("ctx"))
+        except ValueError as e:
+            return "Error: %s" % e
+        if _tenants is None:
+            from .tenants import TenantPool
+            _tenants = TenantPool(_build_tenant_client, TENANT_POOL_SIZE, TENANT_IDLE_TTL)
+            metrics.add_collector(_tenant_gauges)
+        try:
+            async with _tenants.lease(api_key, private_pem) as client:
+                token = _tenant_client.set(client)
+                try:
+                    return await fn(*args, **kwargs)
+                finally:
+                    _tenant_client.reset(token)
+        except Exception as e:
+            # Tools report their own errors; this is a client that could not be built.
+            logger.error("Tenant request failed: %s: %s", type(e).__name__, e, exc_info=DEBUG)
+            return "Error: %s" % e
+    return wrapper
+
+
+def _tenant_gauges() -> dict:
+    return {"tenant_" + k: v for k, v in _tenants.stats().items()} if _tenants is not None else {}
+
+
+def _client_gauges(client: "AsyncMemoClient") -> dict:
+    gauges = {}
+    gauges.update({"key_cache_" + k: v for k, v in client.key_cache.stats().items()})
+    gauges.update({"page_cache_" + k: v for k, v in client.page_cache.stats().items()})
+    gauges.update({"prefetch_" + k: v for k, v in client.prefetch_cache.stats().items()})
+    if client.search_index is not None:
+        gauges["search_index_size"] = len(client.search_index)
+    if client.sync_store is not None:
+        gauges["sync_store_size"] = len(client.sync_store)
+    return gauges
+
+
+def _cache_gauges() -> dict:
+    gauges = _client_gauges(_client) if _client is not None else {}
+    if _flusher is not None:
+        gauges.update({"write_queue_" + k: v for k, v in _flusher.outbox.counts().items()})
+    return gauges
+
+
+async def _queue_save(item: dict) -> dict:
+    """Encrypt a save and append it to the write-ahead queue; the flusher uploads it."""
+    client = get_client()
+    payload = await client.prepare_memory(**item)
+
+    def enqueue() -> tuple:
+        provisional_id, queued = _flusher.outbox.enqueue(payload)
+        if client.search_index is not None:
+            # The flusher uploads without the plaintext, so index it now under the
+            # provisional id; the flusher renames it to the real id once uploaded.
+            client.search_index.upsert([{
+                "id": provisional_id,
+                "handle": queued["handle"],
+                "idempotent_key": queued["idempotent_key"],
+                "description": queued["description"],
+                "content": item["content"],
+            }])
+        return provisional_id, queued
+
+    provisional_id, payload = await asyncio.to_thread(enqueue)
+    _flusher.wake()
+    return {"ok": True, "memory_id": provisional_id, "idempotent_key": payload["idempotent_key"]}
+
+
+def _queue_notice() -> str:
+    """Tell the assistant about queued saves the API rejected since the last notice."""
+    if _flusher is None:
+        return ""
+    rejected = _flusher.take_rejected()
+    if not rejected:
+        return ""
+    lines = ["", "Note: %d queued save(s) were rejected by the API and NOT stored:" % len(rejected)]
+    for r in rejected:
+        lines.append("- %s [%s] %s: %s" % (r["id"], r["handle"], r["description"], r["error"]))
+    lines.append("Use failed_saves to retry or discard them.")
+    return "\n".join(lines)
 
 
 def _format_payload(payload: dict) -> dict:
@@ -74,12 +333,15 @@ def _format_payload(payload: dict) -> dict:
 
 
 @mcp.tool()
+@metrics.timed("tool.save_memory")
+@_per_tenant
 async def save_memory(
     content: str,
     handle: str = "general",
     description: str = "",
     metadata: dict = {},
     idempotent_key: str = "",
+    ctx: Optional[Context] = None,
 ) -> str:
     """
     Archives a high-density knowledge asset using the Semantic Fingerprint Protocol.
@@ -102,7 +364,21 @@ async def save_memory(
         "save_memory called: handle=%s description_len=%s content_length=%s idempotent_key=%s",
         handle, len(description), len(content), idempotent_key or "(new)")
     try:
-        result = client.add_memory(
+        get_client()
+        if _flusher is not None:
+            queued = await _queue_save(dict(
+                content=content,
+                handle=handle,
+                description=description,
+                metadata=metadata,
+                idempotent_key=idempotent_key,
+            ))
+            return (
+                f"Queued for upload. Provisional ID: {queued['memory_id']}, "
+                f"Idempotent Key: {queued['idempotent_key']} "
+            ) + _queue_notice()
+
+        result = await get_client().add_memory(
             content,
             handle=handle,
             description=description,
@@ -111,12 +387,8 @@ async def save_memory(
         )
         logger.debug(f"add_memory response: {result}")
 
-        memory_id = result.get("memory_id")
-        idempotent_key = result.get("idempotent_key")
-        if not memory_id and result.get("data") and isinstance(result["data"], list) and len(result["data"]) > 0:
-            first = result["data"][0]
-            memory_id = first.get("id")
-            idempotent_key = first.get("idempotent_key") or idempotent_key
+        from .client import memory_ref
+        memory_id, idempotent_key = memory_ref(result)
 
         if not memory_id:
             resp_keys = list(result.keys()) if isinstance(
@@ -152,12 +424,160 @@ async def save_memory(
         )
 
 
+_BATCH_FIELDS = ("content", "handle", "description", "metadata", "idempotent_key")
+
+
 @mcp.tool()
+@metrics.timed("tool.save_memories")
+@_per_tenant
+async def save_memories(memories: list[dict], ctx: Optional[Context] = None) -> str:
+    """
+    Archives several knowledge assets in one call, e.g. when persisting a whole session.
+    Prefer this over repeated save_memory calls: items are encrypted and uploaded concurrently.
+
+    :param memories: List of objects with the same fields as save_memory:
+                     content (required), handle, description, metadata, idempotent_key.
+                     The same constraints apply to each field.
+
+    Returns one line per item, in order. A failed item is reported on its own line
+    and does not prevent the others from being saved; retry only the failed ones.
+    """
+    logger.debug("save_memories called: count=%s", len(memories))
+    if not memories:
+        return "No memories to save."
+
+    items = []
+    for m in memories:
+        item = {k: m[k] for k in _BATCH_FIELDS if k in m and m[k] is not None}
+        item.setdefault("content", "")
+        item.setdefault("handle", "general")
+        items.append(item)
+    results = [None] * len(items)
+    pending = []
+    for i, item in enumerate(items):
+        if not item["content"]:
+            results[i] = {"index": i, "ok": False, "error": "content is required"}
+        else:
+            pending.append(i)
+
+    try:
+        client = get_client()
+        if _flusher is not None:
+            saved = []
+            for i in pending:
+                # Isolate items like add_memories does: earlier ones are already queued.
+                try:
+                    saved.append(await _queue_save(items[i]))
+                except Exception as e:
+                    logger.warning("save_memories item %s failed: %s", i, e)
+                    saved.append(client._batch_result(i, error=e))
+        else:
+            saved = await client.add_memories([items[i] for i in pending])
+    except Exception as e:
+        logger.error(
+            f"Error saving memories: {type(e).__name__}: {str(e)}", exc_info=DEBUG)
+        return f"Failed to save your memories: {str(e)}"
+    for i, r in zip(pending, saved):
+        results[i] = r
+
+    ok = sum(1 for r in results if r["ok"])
+    verb = "Queued" if _flusher is not None else "Saved"
+    lines = [f"{verb} {ok}/{len(results)} memories."]
+    for i, r in enumerate(results):
+        if r["ok"]:
+            lines.append(
+                f"[{i}] OK handle: {items[i]['handle']} ID: {r['memory_id']}, "
+                f"Idempotent Key: {r.get('idempotent_key') or 'N/A'}")
+        else:
+            lines.append(f"[{i}] FAILED handle: {items[i]['handle']} error: {r['error']}")
+    logger.info("save_memories: %s/%s saved", ok, len(results))
+    return "\n".join(lines) + _queue_notice()
+
+
+# Rough characters-per-token ratio used to turn max_tokens into a character budget.
+_CHARS_PER_TOKEN = 4
+# Don't start a memory's content with less room than this; leave it for the next call.
+_MIN_CONTENT_SLICE = 200
+
+
+class _ResultBudget:
+    """
+    Accumulates memory blocks into a tool result without exceeding ``max_chars``.
+
+    Content longer than the per-memory limit or the remaining budget is cut with a
+    hint to continue via get_memory. The first memory is always rendered (possibly
+    without content) so a call never returns nothing.
+    """
+
+    def __init__(self, mode: str, total: int, max_chars: int, content_chars: int):
+        self.mode = mode
+        self.max_chars = max_chars if max_chars > 0 else sys.maxsize
+        self.content_chars = content_chars if content_chars > 0 else sys.maxsize
+        self.lines = ["### Retrieved Memories (mode=%s):" % mode, "Total: %s" % total]
+        self.used = sum(len(line) + 1 for line in self.lines)
+        self.rendered = 0
+
+    @property
+    def remaining(self) -> int:
+        return self.max_chars - self.used
+
+    def add(self, m: dict) -> bool:
+        """Render one memory; return False (adding nothing) once the budget is spent."""
+        block = [
+            "ID: %s" % m.get("id", ""),
+            "Handle: [%s]" % m.get("handle", ""),
+            "Idempotent Key: %s" % (m.get("idempotent_key") or "N/A"),
+            "Created: %s" % m.get("created_at", ""),
+            "Metadata: %s" % (json.dumps(m["metadata"], ensure_ascii=False) if m.get("metadata") else "{}"),
+        ]
+        if self.mode != "metadata":
+            block.append("Description: %s" % (m.get("description") or ""))
+        text = "\n".join(block)
+        if self.mode == "full":
+            content = m.get("content") or ""
+            # Reserve room for the "---" separator and a truncation hint.
+            room = min(self.content_chars, self.remaining - len(text) - 160)
+            if self.rendered and room < min(len(content), _MIN_CONTENT_SLICE):
+                return False
+            shown = content[:max(room, 0)]
+            text += "\nContent: %s" % shown
+            if len(shown) < len(content):
+                text += (
+                    "\n[Truncated: showing %d of %d characters. Continue with "
+                    "get_memory(memory_id=\"%s\", handle=\"%s\", offset=%d)]"
+                    % (len(shown), len(content), m.get("id", ""), m.get("handle", ""), len(shown))
+                )
+        elif self.rendered and len(text) + 4 > self.remaining:
+            return False
+        self.lines.append(text)
+        self.lines.append("---")
+        self.used += len(text) + 5
+        self.rendered += 1
+        return True
+
+    def render(self, omitted: list, next_cursor: str) -> str:
+        if omitted:
+            self.lines.append(
+                "Output budget reached: %d more memories on this page were not shown (IDs: %s). "
+                "Read them with get_memory, or call again with a smaller limit or a larger max_chars."
+                % (len(omitted), ", ".join(str(m.get("id", "")) for m in omitted))
+            )
+        if next_cursor:
+            self.lines.append("Next cursor (for next page): %s" % next_cursor)
+        return "\n".join(self.lines)
+
+
+@mcp.tool()
+@metrics.timed("tool.load_memories")
+@_per_tenant
 async def load_memories(
     handle: Optional[str] = None,
     limit: int = 20,
     cursor: str = "",
     mode: str = "summary",
+    max_chars: int = 0,
+    max_tokens: int = 0,
+    ctx: Optional[Context] = None,
 ) -> str:
     """
     Retrieve previously stored memories with pagination and optional lightweight modes to reduce token usage.
@@ -173,7 +593,11 @@ async def load_memories(
       - "summary": Only description + metadata + id/handle/idempotent_key (no content). Best first step to scan and decide.
       - "metadata": Only id, handle, created_at, metadata (no description, no content). Smallest payload.
       - "full": Full content (decrypted). Use after you know you need details for this page; same cursor/limit as the summary page to get that page's full content.
+    :param max_chars: Optional. Upper bound on the size of this response in characters (0 = server default).
+    :param max_tokens: Optional. Same bound expressed in tokens (about 4 characters each); the smaller bound wins.
 
+    Long contents are truncated with a hint to continue reading them with get_memory. When the budget runs out
+    the remaining memories of the page are listed by ID only.
     The response includes a "Next cursor" line when there are more results; pass it as cursor in the next call to get the next page.
     Each memory includes Idempotent Key for updating via save_memory with the same idempotent_key.
     """
@@ -185,15 +609,29 @@ async def load_memories(
         if mode not in ("summary", "metadata", "full"):
             return f"Invalid mode: {mode}. Use 'summary', 'metadata', or 'full'."
 
-        memories, next_cursor, total = client.get_memories(
-            handle=handle,
-            limit=limit if limit > 0 else 20,
-            cursor=cursor,
-            only_metadata=only_metadata,
-            only_summary=only_summary,
-        )
+        client = get_client()
+        limit = limit if limit > 0 else 20
+        # A summary page is usually followed by the full page for the same cursor,
+        # which may already have been fetched and decrypted in the background.
+        page = await client.prefetched(handle, limit, cursor) if mode == "full" else None
+        if page is not None:
+            memories, next_cursor, total, ready = page
+            logger.debug("Serving full page from prefetch (%s of %s decrypted)", ready, len(memories))
+        else:
+            # Full content is decrypted below, chunk by chunk, only as far as the budget reaches.
+            memories, next_cursor, total = await client.get_memories(
+                handle=handle,
+                limit=limit,
+                cursor=cursor,
+                only_metadata=only_metadata,
+                only_summary=only_summary,
+                decrypt=False,
+            )
+            ready = 0
         logger.debug("Retrieved %s memories, total=%s, next_cursor=%s",
                      len(memories), total, bool(next_cursor))
+        if mode == "summary" and memories:
+            client.prefetch(handle, limit, cursor, next_cursor if PREFETCH_NEXT else "")
 
         if not memories:
             msg = f"No memories found for handle: {handle if handle else 'all'}."
@@ -201,32 +639,30 @@ async def load_memories(
                 msg += " (Try without cursor for first page.)"
             if total > 0:
                 msg += " (Total matching: %s)" % total
-            return msg
-
-        lines = ["### Retrieved Memories (mode=%s):" % mode]
-        lines.append("Total: %s" % total)
-        for m in memories:
-            handle_value = m.get("handle", "")
-            idempotent_key = m.get("idempotent_key") or "N/A"
-            meta = m.get("metadata")
-            meta_str = json.dumps(meta, ensure_ascii=False) if meta else "{}"
-            created = m.get("created_at", "")
-            block = [
-                "Handle: [%s]" % handle_value,
-                "Idempotent Key: %s" % idempotent_key,
-                "Created: %s" % created,
-                "Metadata: %s" % meta_str,
-            ]
-            if not only_metadata:
-                block.append("Description: %s" % (m.get("description") or ""))
-            if not only_metadata and not only_summary:
-                block.append("Content: %s" % (m.get("content") or ""))
-            lines.append("\n".join(block))
-            lines.append("---")
-        if next_cursor:
-            lines.append("Next cursor (for next page): %s" % next_cursor)
-        logger.info("Loaded %s memories (mode=%s)", len(memories), mode)
-        return "\n".join(lines)
+            return msg + _queue_notice()
+
+        budgets = [b for b in (MAX_RESULT_CHARS, max_chars, max_tokens * _CHARS_PER_TOKEN) if b > 0]
+        out = _ResultBudget(mode, total, min(budgets, default=0), MAX_CONTENT_CHARS)
+        step = client.decrypt_workers if mode == "full" else len(memories)
+        shown = 0
+        while shown < len(memories):
+            chunk = memories[shown:shown + step]
+            pending = chunk[max(0, ready - shown):]
+            if mode == "full" and pending:
+                await client.decrypt_memories(pending)
+            with metrics.span("format", mode=mode):
+                added = 0
+                for m in chunk:
+                    if not out.add(m):
+                        break
+                    added += 1
+            shown += added
+            if added < len(chunk):
+                break
+        result = out.render(memories[shown:], next_cursor)
+        logger.info("Loaded %s of %s memories (mode=%s, %s chars)",
+                    shown, len(memories), mode, len(result))
+        return result + _queue_notice()
     except Exception as e:
         logger.error(
             "Error retrieving memories: %s: %s", type(e).__name__, str(e), exc_info=DEBUG
@@ -234,6 +670,217 @@ async def load_memories(
         return "Error retrieving memories: %s" % str(e)
 
 
+@mcp.tool()
+@metrics.timed("tool.get_memory")
+@_per_tenant
+async def get_memory(
+    memory_id: str,
+    offset: int = 0,
+    length: int = 0,
+    handle: Optional[str] = None,
+    ctx: Optional[Context] = None,
+) -> str:
+    """
+    Read one memory's decrypted content in character ranges. Use it to continue a content that
+    load_memories truncated, or to read a memory listed by ID after the output budget ran out.
+
+    :param memory_id: The memory ID (the "ID:" line in load_memories or search_memories results).
+    :param offset: Character offset to start reading from (default 0).
+    :param length: Number of characters to return (0 = server default chunk size).
+    :param handle: Optional. The memory's handle; speeds up the lookup when the memory is not cached.
+
+    The response ends with the offset to pass for the next range while more content remains.
+    """
+    logger.debug("get_memory called: memory_id=%s offset=%s length=%s", memory_id, offset, length)
+    try:
+        memory = await get_client().find_memory(memory_id, handle=handle)
+        if memory is None:
+            return f"Memory not found: {memory_id}"
+        content = memory.get("content") or ""
+        offset = min(max(offset, 0), len(content))
+        if length <= 0:
+            length = MAX_CONTENT_CHARS if MAX_CONTENT_CHARS > 0 else len(content)
+        end = min(offset + length, len(content))
+        lines = [
+            "ID: %s" % memory.get("id", memory_id),
+            "Handle: [%s]" % memory.get("handle", ""),
+            "Idempotent Key: %s" % (memory.get("idempotent_key") or "N/A"),
+            "Description: %s" % (memory.get("description") or ""),
+            "Characters: %d-%d of %d" % (offset, end, len(content)),
+            "Content: %s" % content[offset:end],
+        ]
+        if end < len(content):
+            lines.append('[More content: call get_memory(memory_id="%s", handle="%s", offset=%d)]'
+                         % (memory.get("id", memory_id), memory.get("handle", ""), end))
+        return "\n".join(lines)
+    except Exception as e:
+        logger.error(
+            "Error reading memory: %s: %s", type(e).__name__, str(e), exc_info=DEBUG
+        )
+        return "Error reading memory: %s" % str(e)
+
+
+@mcp.tool()
+@metrics.timed("tool.sync_memories")
+@_per_tenant
+async def sync_memories(
+    handle: Optional[str] = None,
+    full: bool = False,
+    ctx: Optional[Context] = None,
+) -> str:
+    """
+    Bring the local memory store up to date by downloading only new or changed memories. Pages are
+    compared in metadata mode first, so a sync with nothing new transfers no content. Call once at the
+    start of a session; afterwards search_memories answers from the local copy without re-decrypting.
+
+    :param handle: Optional. Sync one handle. Omit to sync all handles.
+    :param full: If true, download and decrypt everything again.
+
+    The response lists the IDs of new or changed memories.
+    """
+    logger.debug("sync_memories called: handle=%s full=%s", handle, full)
+    try:
+        client = get_client()
+        if client.sync_store is None:
+            return "Sync is disabled (set MEMO_SYNC=true to keep a local store)."
+        changed = await client.sync(handle=handle, since="" if full else None)
+        store = client.sync_store
+        lines = [
+            "Synced %s: %s new or changed memories." % (handle or "all handles", len(changed)),
+            "Local store: %s memories. Newest change seen: %s"
+            % (await asyncio.to_thread(len, store),
+               await asyncio.to_thread(store.watermark, handle) or "none"),
+        ]
+        for m in changed:
+            lines.append("- ID: %s [%s] %s" % (m.get("id"), m.get("handle", ""), m.get("description") or ""))
+        return "\n".join(lines)
+    except Exception as e:
+        logger.error(
+            "Error syncing memories: %s: %s", type(e).__name__, str(e), exc_info=DEBUG
+        )
+        return "Error syncing memories: %s" % str(e)
+
+
+@mcp.tool()
+@metrics.timed("tool.search_memories")
+@_per_tenant
+async def search_memories(
+    query: str,
+    handle: Optional[str] = None,
+    limit: int = 10,
+    ctx: Optional[Context] = None,
+) -> str:
+    """
+    Full-text search over memories, answered locally in milliseconds instead of paging with load_memories.
+
+    Content is end-to-end encrypted, so search runs on an on-device index of memories this server has
+    already decrypted (loaded with mode='full') or saved. If nothing relevant is found, page through
+    load_memories with mode='full' once to fill the index, then search again.
+
+    :param query: Plain words to look for in content and description. Results matching more (and rarer) words rank first.
+    :param handle: Optional. Restrict results to one handle.
+    :param limit: Maximum number of results (default 10).
+
+    Each result includes the memory ID, handle, Idempotent Key and a snippet with matches in [brackets].
+    """
+    logger.debug("search_memories called: query=%s handle=%s limit=%s", query, handle, limit)
+    try:
+        index = get_client().search_index
+        if index is None:
+            return "Search is disabled (MEMO_SEARCH_INDEX=false)."
+        results = await asyncio.to_thread(index.search, query, handle, limit if limit > 0 else 10)
+        indexed = await asyncio.to_thread(len, index)
+        if not results:
+            return (
+                f"No indexed memories match: {query} ({indexed} memories indexed). "
+                "Load memories with mode='full' to index more."
+            )
+        lines = ["### Search results for: %s" % query]
+        lines.append("Indexed memories: %s" % indexed)
+        for r in results:
+            lines.append("\n".join([
+                "ID: %s" % r["id"],
+                "Handle: [%s]" % r["handle"],
+                "Idempotent Key: %s" % (r["idempotent_key"] or "N/A"),
+                "Created: %s" % r["created_at"],
+                "Description: %s" % r["description"],
+                "Snippet: %s" % r["snippet"],
+            ]))
+            lines.append("---")
+        logger.info("search_memories: %s results", len(results))
+        return "\n".join(lines)
+    except Exception as e:
+        logger.error(
+            "Error searching memories: %s: %s", type(e).__name__, str(e), exc_info=DEBUG
+        )
+        return "Error searching memories: %s" % str(e)
+
+
+@mcp.tool()
+@metrics.timed("tool.failed_saves")
+@_per_tenant
+async def failed_saves(
+    retry: Optional[list[str]] = None,
+    discard: Optional[list[str]] = None,
+    ctx: Optional[Context] = None,
+) -> str:
+    """
+    List queued saves the API rejected (requires MEMO_WRITE_QUEUE=true), and retry or discard them.
+    Rejected saves were acknowledged as "Queued for upload" but are NOT stored.
+
+    :param retry: Optional. Provisional IDs (pending-...) to upload again, e.g. after fixing the cause.
+    :param discard: Optional. Provisional IDs to delete from the queue for good.
+
+    The response lists the saves that are still failed, with the error the API returned.
+    """
+    logger.debug("failed_saves called: retry=%s discard=%s", retry, discard)
+    try:
+        get_client()
+        if _flusher is None:
+            return "The write queue is disabled (MEMO_WRITE_QUEUE=false); saves are never queued."
+        outbox = _flusher.outbox
+        lines = []
+        if retry:
+            moved = await asyncio.to_thread(outbox.requeue, retry)
+            _flusher.wake()
+            lines.append("Re-queued %d save(s) for upload." % moved)
+        if discard:
+            dropped = await asyncio.to_thread(outbox.discard, discard)
+            lines.append("Discarded %d save(s)." % dropped)
+        failed = await asyncio.to_thread(outbox.failed)
+        # Everything still failed is listed here, so don't repeat it on the next result.
+        _flusher.take_rejected()
+        if not failed:
+            lines.append("No failed saves in the queue.")
+        else:
+            lines.append("%d failed save(s):" % len(failed))
+            for r in failed:
+                lines.append("- ID: %s [%s] Idempotent Key: %s Description: %s Error: %s"
+                             % (r["id"], r["handle"], r["idempotent_key"], r["description"], r["error"]))
+        return "\n".join(lines)
+    except Exception as e:
+        logger.error(
+            "Error listing failed saves: %s: %s", type(e).__name__, str(e), exc_info=DEBUG
+        )
+        return "Error listing failed saves: %s" % str(e)
+
+
+@mcp.tool()
+@_per_tenant
+async def stats(ctx: Optional[Context] = None) -> str:
+    """
+    Report client performance statistics as JSON: timing spans (encryption, RSA wrap/unwrap,
+    signing, HTTP, JSON decode, per-item decryption, formatting, per tool), byte and failure
+    counters, and cache/queue gauges. Spans and counters are only collected when the server
+    runs with MEMO_METRICS=true; gauges are always reported.
+    """
+    snapshot = await asyncio.to_thread(metrics.snapshot)
+    if MULTI_TENANT:
+        # Cache gauges of the caller's own client; other tenants' clients are not reported.
+        snapshot["gauges"].update(await asyncio.to_thread(_client_gauges, get_client()))
+    return json.dumps(snapshot, indent=2)
+
+
 def run_with_debug(host: str = "127.0.0.1", port: int = 5678) -> None:
     """Run MCP server with debugpy so Cursor/VS Code can attach for breakpoint debugging."""
     try:
@@ -246,11 +893,24 @@ def run_with_debug(host: str = "127.0.0.1", port: int = 5678) -> None:
     print(
         f"Debugger listening on {host}:{port}. Attach from Cursor/VS Code.", file=sys.stderr)
     debugpy.wait_for_client()
-    mcp.run()
+    main()
+
+
+def main() -> None:
+    """Run the MCP server over MEMO_TRANSPORT (stdio by default)."""
+    if TRANSPORT not in ("stdio", "sse", "streamable-http"):
+        raise SystemExit(f"Unknown MEMO_TRANSPORT: {TRANSPORT}. Use stdio, sse or streamable-http.")
+    if MULTI_TENANT:
+        if TRANSPORT == "stdio":
+            raise SystemExit("MEMO_MULTI_TENANT needs MEMO_TRANSPORT=sse or streamable-http")
+        if WRITE_QUEUE or SYNC:
+            logger.warning("MEMO_WRITE_QUEUE and MEMO_SYNC are single-user and ignored in multi-tenant mode")
+        logger.info("Multi-tenant server on %s:%s (%s)", HOST, PORT, TRANSPORT)
+    mcp.run(transport=TRANSPORT)
 
 
 if __name__ == "__main__":
     if os.getenv("MCP_DEBUG") == "1":
         run_with_debug()
     else:
-        mcp.run()
+        main()
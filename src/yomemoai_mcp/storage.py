@@ -0,0 +1,18 @@
+import os
+import sqlite3
+
+
+def open_db(path: str) -> sqlite3.Connection:
+    """
+    Open a local SQLite file readable only by the current user.
+
+    ``":memory:"`` gives a private in-process database instead.
+    """
+    if path != ":memory:":
+        path = os.path.expanduser(path)
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, mode=0o700, exist_ok=True)
+        # Create with 0600 up front so the data never sits in a world-readable file.
+        os.close(os.open(path, os.O_CREAT | os.O_RDWR, 0o600))
+    return sqlite3.connect(path, check_same_thread=False)
@@ -0,0 +1,183 @@
+import json
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .storage import open_db
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS memories (
+    memory_id TEXT PRIMARY KEY,
+    handle TEXT NOT NULL,
+    idempotent_key TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    changed_at TEXT NOT NULL,
+    description TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    content TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS memories_handle ON memories (handle, created_at);
+CREATE TABLE IF NOT EXISTS watermarks (
+    handle TEXT PRIMARY KEY,
+    watermark TEXT NOT NULL,
+    synced_at REAL NOT NULL
+);
+"""
+
+
+def change_stamp(memory: Dict[str, Any]) -> str:
+    """
+    Return a memory's last-change time as a sortable UTC ISO-8601 string.
+
+    Uses ``updated_at`` when the API provides it, else ``created_at``;
+    returns "" when neither parses.
+    """
+    value = memory.get("updated_at") or memory.get("created_at") or ""
+    try:
+        ts = datetime.fromisoformat(str(value))
+    except ValueError:
+        return ""
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+class SyncStore:
+    """
+    Local copy of decrypted memories plus a sync watermark per handle.
+
+    Filled by ``sync()`` on the clients, which compares each memory's change
+    stamp with the stored one and downloads only what differs, and kept in
+    step with this client's own saves. The per-handle watermark is only a
+    "last seen" marker (the newest change stamp the last sync saw, for
+    display); it does not limit what the next sync lists, because the API
+    orders memories by creation time, not by change. Like the search index
+    it holds plaintext; keep the file on a trusted device.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = open_db(path)
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def watermark(self, handle: Optional[str]) -> str:
+        """Newest change stamp seen by a sync of ``handle`` ("" if never); informational only."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT watermark FROM watermarks WHERE handle = ?", (handle or "",)).fetchone()
+        return row[0] if row else ""
+
+    def stamps(self, memory_ids: Iterable[str]) -> Dict[str, str]:
+        """Return ``{memory_id: change stamp}`` for the ids already stored."""
+        ids = [str(i) for i in memory_ids]
+        if not ids:
+            return {}
+        marks = ",".join("?" * len(ids))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT memory_id, changed_at FROM memories WHERE memory_id IN ({marks})", ids
+            ).fetchall()
+        return dict(rows)
+
+    def merge(self, handle: Optional[str], memories: List[Dict[str, Any]], watermark: str) -> None:
+        """Upsert decrypted memories and advance ``handle``'s watermark in one transaction."""
+        rows = [
+            (
+                str(m["id"]),
+                m.get("handle") or "",
+                m.get("idempotent_key") or "",
+                m.get("created_at") or "",
+                change_stamp(m),
+                m.get("description") or "",
+                json.dumps(m.get("metadata") or {}, ensure_ascii=False),
+                m.get("content") or "",
+            )
+            for m in memories
+            if m.get("id") is not None
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO memories VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self._conn.execute(
+                "INSERT INTO watermarks (handle, watermark, synced_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(handle) DO UPDATE SET "
+                "watermark = max(watermark, excluded.watermark), synced_at = excluded.synced_at",
+                (handle or "", watermark, time.time()),
+            )
+
+    def put(self, memory: Dict[str, Any]) -> None:
+        """
+        Upsert one memory saved by this client, outside a sync.
+
+        Its change stamp is left empty, so the next sync downloads it once
+        and records the server's stamp; an existing row keeps its ``created_at``.
+        """
+        created_at = memory.get("created_at") or datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO memories VALUES (?, ?, ?, ?, '', ?, ?, ?) "
+                "ON CONFLICT(memory_id) DO UPDATE SET handle = excluded.handle, "
+                "idempotent_key = excluded.idempotent_key, changed_at = '', "
+                "description = excluded.description, metadata = excluded.metadata, "
+                "content = excluded.content",
+                (
+                    str(memory["id"]),
+                    memory.get("handle") or "",
+                    memory.get("idempotent_key") or "",
+                    created_at,
+                    memory.get("description") or "",
+                    json.dumps(memory.get("metadata") or {}, ensure_ascii=False),
+                    memory.get("content") or "",
+                ),
+            )
+
+    def discard(self, memory_id: str) -> None:
+        """Forget one memory, e.g. one saved without its plaintext at hand."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM memories WHERE memory_id = ?", (str(memory_id),))
+
+    def get(self, memory_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM memories WHERE memory_id = ?", (str(memory_id),)).fetchone()
+        return self._memory(row) if row else None
+
+    def iter_memories(self, handle: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Yield stored memories, newest first, optionally for one handle."""
+        sql = "SELECT * FROM memories"
+        params: List[Any] = []
+        if handle:
+            sql += " WHERE handle = ?"
+            params.append(handle)
+        sql += " ORDER BY created_at DESC"
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        for row in rows:
+            yield self._memory(row)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT count(*) FROM memories").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _memory(row: tuple) -> Dict[str, Any]:
+        memory_id, handle, key, created_at, _, description, metadata, content = row
+        return {
+            "id": memory_id,
+            "handle": handle,
+            "idempotent_key": key,
+            "created_at": created_at,
+            "description": description,
+            "metadata": json.loads(metadata),
+            "content": content,
+        }
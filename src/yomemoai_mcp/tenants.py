@@ -0,0 +1,153 @@
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, Optional
+
+from .client import AsyncMemoClient
+
+logger = logging.getLogger(__name__)
+
+
+class _Tenant:
+    __slots__ = ("client", "last_used", "leases", "evicted")
+
+    def __init__(self, client: AsyncMemoClient):
+        self.client = client
+        self.last_used = time.monotonic()
+        self.leases = 0
+        self.evicted = False
+
+
+class TenantPool:
+    """
+    LRU pool of API clients, one per set of tenant credentials.
+
+    Each tenant gets its own parsed private key, HTTP connection pool and
+    caches, built once and reused across requests. Tenants idle longer than
+    ``idle_ttl`` seconds, or beyond ``max_size``, are evicted and closed,
+    which zeroes their cached AES keys. A client still serving a request is
+    closed when its last lease is released.
+
+    Credentials are never kept as dict keys: entries are indexed by a
+    SHA-256 digest of the API key and private key.
+
+    :param factory: Builds a client from ``(api_key, private_key_pem)``
+    :param max_size: Maximum number of live tenants
+    :param idle_ttl: Seconds of inactivity before a tenant is evicted (0 = never)
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[str, str], AsyncMemoClient],
+        max_size: int = 64,
+        idle_ttl: float = 900.0,
+    ):
+        self.factory = factory
+        self.max_size = max(1, max_size)
+        self.idle_ttl = idle_ttl
+        self.created = 0
+        self.evictions = 0
+        self._tenants: "OrderedDict[bytes, _Tenant]" = OrderedDict()
+        self._lock = asyncio.Lock()
+        self._sweeper: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def _digest(api_key: str, private_key_pem: str) -> bytes:
+        h = hashlib.sha256()
+        h.update(api_key.encode())
+        h.update(b"\0")
+        h.update(private_key_pem.strip().encode())
+        return h.digest()
+
+    @asynccontextmanager
+    async def lease(self, api_key: str, private_key_pem: str) -> AsyncIterator[AsyncMemoClient]:
+        """Yield the tenant's client, building it on first use; it stays open while leased."""
+        digest = self._digest(api_key, private_key_pem)
+        if self._sweeper is None and self.idle_ttl > 0:
+            self._sweeper = asyncio.create_task(self._sweep_forever())
+        async with self._lock:
+            tenant = self._tenants.get(digest)
+            if tenant is None:
+                # Parsing the key is CPU-bound; keep the event loop free.
+                client = await asyncio.to_thread(self.factory, api_key, private_key_pem)
+                tenant = _Tenant(client)
+                self._tenants[digest] = tenant
+                self.created += 1
+            self._tenants.move_to_end(digest)
+            tenant.leases += 1
+            tenant.last_used = time.monotonic()
+            stale = self._evict_locked()
+        await self._close_all(stale)
+        try:
+            yield tenant.client
+        finally:
+            tenant.leases -= 1
+            tenant.last_used = time.monotonic()
+            if tenant.evicted and tenant.leases == 0:
+                await self._close_all([tenant])
+
+    def _evict_locked(self) -> list:
+        """Drop idle and over-capacity tenants; return those ready to close now."""
+        now = time.monotonic()
+        victims = []
+        if self.idle_ttl > 0:
+            victims = [d for d, t in self._tenants.items()
+                       if t.leases == 0 and now - t.last_used > self.idle_ttl]
+        overflow = len(self._tenants) - len(victims) - self.max_size
+        for digest in self._tenants:
+            if overflow <= 0:
+                break
+            if digest not in victims:
+                victims.append(digest)
+                overflow -= 1
+        closable = []
+        for digest in victims:
+            tenant = self._tenants.pop(digest)
+            tenant.evicted = True
+            self.evictions += 1
+            if tenant.leases == 0:
+                closable.append(tenant)
+        return closable
+
+    async def _close_all(self, tenants: list) -> None:
+        for tenant in tenants:
+            try:
+                await tenant.client.aclose()
+            except Exception as e:
+                logger.warning("Closing evicted tenant client failed: %s", e)
+
+    async def sweep(self) -> None:
+        """Evict tenants that have been idle longer than ``idle_ttl``."""
+        async with self._lock:
+            stale = self._evict_locked()
+        await self._close_all(stale)
+
+    async def _sweep_forever(self) -> None:
+        # Evict idle tenants even when no new requests arrive to trigger it.
+        while True:
+            await asyncio.sleep(max(1.0, self.idle_ttl / 2))
+            await self.sweep()
+
+    async def aclose(self) -> None:
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            self._sweeper = None
+        async with self._lock:
+            tenants = list(self._tenants.values())
+            self._tenants.clear()
+        for tenant in tenants:
+            tenant.evicted = True
+        await self._close_all([t for t in tenants if t.leases == 0])
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "tenants": len(self._tenants),
+            "created": self.created,
+            "evictions": self.evictions,
+        }
+
+    def __len__(self) -> int:
+        return len(self._tenants)
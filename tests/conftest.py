@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from fake_server import FakeMemoServer
+from yomemoai_mcp.client import AsyncMemoClient, MemoClient
+
+
+@pytest.fixture(scope="session")
+def private_key_pem() -> str:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+
+
+@pytest.fixture
+def fake_server():
+    with FakeMemoServer() as server:
+        yield server
+
+
+class SyncRunner:
+    """Drive MemoClient with the same call shape as the async runner."""
+
+    def __init__(self, pem, url, **client_kwargs):
+        self.client = MemoClient("test", pem, url, **client_kwargs)
+
+    def add(self, content, **kwargs):
+        return self.client.add_memory(content, handle="t", **kwargs)
+
+    def load(self):
+        return self.client.get_memories(handle="t")
+
+    def sync(self, **kwargs):
+        return self.client.sync(handle="t", **kwargs)
+
+    def find(self, memory_id):
+        return self.client.find_memory(memory_id)
+
+    def close(self):
+        self.client.close()
+
+
+class AsyncRunner:
+    def __init__(self, pem, url, **client_kwargs):
+        self.loop = asyncio.new_event_loop()
+        self.client = AsyncMemoClient("test", pem, url, **client_kwargs)
+
+    def _run(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def add(self, content, **kwargs):
+        return self._run(self.client.add_memory(content, handle="t", **kwargs))
+
+    def load(self):
+        return self._run(self.client.get_memories(handle="t"))
+
+    def sync(self, **kwargs):
+        return self._run(self.client.sync(handle="t", **kwargs))
+
+    def find(self, memory_id):
+        return self._run(self.client.find_memory(memory_id))
+
+    def close(self):
+        self._run(self.client.aclose())
+        self.loop.close()
+
+
+@pytest.fixture(params=[SyncRunner, AsyncRunner], ids=["sync", "async"])
+def runner_factory(request, private_key_pem, fake_server):
+    """
+    Build runners for MemoClient and AsyncMemoClient in turn, against the fake server.
+
+    ``make(url=None, **client_kwargs)`` passes keyword arguments to the client.
+    """
+    runners = []
+
+    def make(url=None, **client_kwargs):
+        runner = request.param(private_key_pem, url or fake_server.url, **client_kwargs)
+        runners.append(runner)
+        return runner
+
+    yield make
+    for runner in runners:
+        runner.close()
@@ -0,0 +1,129 @@
+"""Envelope formats: v1 compatibility with the original client, v2 frames, compression and key schemes."""
+import base64
+import json
+import os
+
+import pytest
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+from yomemoai_mcp.client import MemoClient
+
+OAEP = padding.OAEP(mgf=padding.MGF1(algorithm=hashes.SHA256()), algorithm=hashes.SHA256(), label=None)
+# Large and repetitive enough that compression kicks in.
+TEXT = ("envelope round trip ✓ " * 200).encode()
+
+
+@pytest.fixture
+def make_client(private_key_pem):
+    clients = []
+
+    def make(**kwargs):
+        client = MemoClient("test", private_key_pem, "http://127.0.0.1:9", **kwargs)
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
+
+
+def legacy_pack(client: MemoClient, raw_data: bytes) -> str:
+    """pack_data as the original client wrote it (v1, json.dumps)."""
+    aes_key, nonce = os.urandom(32), os.urandom(12)
+    encryptor = Cipher(algorithms.AES(aes_key), modes.GCM(nonce)).encryptor()
+    ciphertext = encryptor.update(raw_data) + encryptor.finalize()
+    combined_data = base64.b64encode(nonce + ciphertext + encryptor.tag).decode()
+    pkg = {
+        "data": combined_data,
+        "key": base64.b64encode(client.public_key.encrypt(aes_key, OAEP)).decode(),
+        "signature": base64.b64encode(client.private_key.sign(
+            combined_data.encode(), padding.PKCS1v15(), hashes.SHA256())).decode(),
+    }
+    return base64.b64encode(json.dumps(pkg).encode()).decode()
+
+
+def legacy_unpack(client: MemoClient, encrypted_pkg_base64: str) -> bytes:
+    """unpack_and_decrypt as the original client read it."""
+    pkg = json.loads(base64.b64decode(encrypted_pkg_base64))
+    if pkg.get("key"):
+        aes_key = client.private_key.decrypt(base64.b64decode(pkg["key"]), OAEP)
+        combined = base64.b64decode(pkg["data"])
+        decryptor = Cipher(algorithms.AES(aes_key), modes.GCM(combined[:12], combined[-16:])).decryptor()
+        return decryptor.update(combined[12:-16]) + decryptor.finalize()
+    return client.private_key.decrypt(base64.b64decode(pkg["data"]), OAEP)
+
+
+def test_v1_reads_envelopes_written_by_the_original_client(make_client):
+    client = make_client()
+    assert bytes(client.unpack_and_decrypt(legacy_pack(client, TEXT))) == TEXT
+
+
+def test_v1_reads_rsa_only_envelopes(make_client):
+    client = make_client()
+    pkg = {"data": base64.b64encode(client.public_key.encrypt(b"short secret", OAEP)).decode()}
+    assert bytes(client.unpack_and_decrypt(base64.b64encode(json.dumps(pkg).encode()).decode())) == b"short secret"
+
+
+def test_v1_output_is_what_json_dumps_writes(make_client):
+    client = make_client()
+    pkg = base64.b64decode(client.pack_data(TEXT))
+    assert json.dumps(json.loads(pkg)).encode() == pkg
+    assert list(json.loads(pkg)) == ["data", "key", "signature"]
+
+
+def test_v1_output_is_readable_by_the_original_client(make_client):
+    client = make_client()
+    assert legacy_unpack(client, client.pack_data(TEXT)) == TEXT
+
+
+@pytest.mark.parametrize("compression", ["none", "zlib"])
+@pytest.mark.parametrize("version,key_scheme", [(1, "rsa"), (2, "rsa"), (2, "x25519")])
+def test_round_trip(make_client, version, key_scheme, compression):
+    client = make_client(envelope_version=version, key_scheme=key_scheme, compression=compression)
+    packed = client.pack_data(TEXT)
+    if version == 2:
+        frame = base64.b64decode(packed)
+        assert frame[:2] == b"YM"
+        assert frame[3] & 0x03 == (1 if compression == "zlib" else 0)
+    else:
+        assert json.loads(base64.b64decode(packed)).get("compression", "none") == compression
+    # A client with default settings reads every format.
+    assert bytes(make_client().unpack_and_decrypt(packed)) == TEXT
+
+
+def test_unknown_v2_codec_raises(make_client):
+    client = make_client(envelope_version=2)
+    frame = bytearray(base64.b64decode(client.pack_data(TEXT)))
+    frame[3] |= 0x03
+    with pytest.raises(ValueError, match="Unsupported compression"):
+        client.unpack_and_decrypt(base64.b64encode(frame).decode())
+
+
+def test_unknown_v1_codec_raises(make_client):
+    client = make_client(compression="zlib")
+    pkg = json.loads(base64.b64decode(client.pack_data(TEXT)))
+    pkg["compression"] = "lz4"
+    with pytest.raises(ValueError, match="Unsupported compression"):
+        client.unpack_and_decrypt(base64.b64encode(json.dumps(pkg).encode()).decode())
+
+
+def test_unknown_v2_scheme_raises(make_client):
+    client = make_client(envelope_version=2)
+    frame = bytearray(base64.b64decode(client.pack_data(TEXT)))
+    frame[4] = 9
+    with pytest.raises(ValueError, match="Unsupported envelope"):
+        client.unpack_and_decrypt(base64.b64encode(frame).decode())
+
+
+def test_corrupt_item_fails_alone(make_client):
+    client = make_client(envelope_version=2, decrypt_workers=2)
+    memories = [{"id": str(i), "content": client.pack_data(b"memory %d" % i)} for i in range(3)]
+    frame = bytearray(base64.b64decode(memories[1]["content"]))
+    frame[-1] ^= 0x01  # ciphertext byte: the GCM tag no longer verifies
+    memories[1]["content"] = base64.b64encode(frame).decode()
+
+    client.decrypt_memories(memories)
+
+    assert [m["content"] for m in memories] == ["memory 0", "(decryption failed)", "memory 2"]
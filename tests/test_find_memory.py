@@ -0,0 +1,24 @@
+"""find_memory lookups of both clients against the fake API (benchmarks/fake_server.py)."""
+
+
+def test_locates_with_metadata_then_caches_the_full_page(runner_factory, fake_server):
+    runner = runner_factory()
+    for i in range(3):
+        runner.add("memory %d" % i)
+    fake_server.requests = 0
+
+    assert runner.find("1")["content"] == "memory 0"
+    assert fake_server.requests == 2  # one metadata page, then that page in full
+
+    # Reading the next range of the same memory is served from the page cache.
+    assert runner.find("1")["content"] == "memory 0"
+    assert fake_server.requests == 2
+
+
+def test_missing_memory_costs_only_metadata_pages(runner_factory, fake_server):
+    runner = runner_factory(page_cache_size=0)
+    runner.add("memory")
+    fake_server.requests = 0
+
+    assert runner.find("404") is None
+    assert fake_server.requests == 1
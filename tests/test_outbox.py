@@ -0,0 +1,65 @@
+"""Write-ahead queue replay against the fake API (benchmarks/fake_server.py)."""
+import asyncio
+
+import pytest
+
+from yomemoai_mcp.client import AsyncMemoClient
+from yomemoai_mcp.outbox import Outbox, OutboxFlusher
+from yomemoai_mcp.retry import RetryPolicy
+
+
+@pytest.mark.parametrize("max_retries", [1, 0], ids=["client-retry", "queue-backoff"])
+def test_newest_save_for_a_key_wins(private_key_pem, fake_server, tmp_path, max_retries):
+    """A transient failure of an older queued save must not let it overwrite a newer one."""
+    retry = RetryPolicy(max_retries=max_retries, backoff_base=0.001, backoff_max=0.001)
+
+    async def run():
+        client = AsyncMemoClient("test", private_key_pem, fake_server.url, page_cache_size=0, retry=retry)
+        outbox = Outbox(str(tmp_path / "outbox.db"))
+        flusher = OutboxFlusher(client, outbox, max_backoff=0.05)
+        try:
+            await client.add_memory("v0", handle="t", idempotent_key="K")
+            for content in ("v1", "v2"):
+                outbox.enqueue(await client.prepare_memory(content, handle="t", idempotent_key="K"))
+            fake_server.fail_next(1, status=503, retry_after="0.3")
+            flusher.wake()
+            await flusher._task
+
+            memories, _, _ = await client.get_memories(handle="t")
+            assert [m["content"] for m in memories] == ["v2"]
+            assert outbox.counts() == {"pending": 0, "failed": 0}
+        finally:
+            outbox.close()
+            await client.aclose()
+
+    asyncio.run(run())
+
+
+def test_rejected_save_is_reported_and_can_be_requeued(private_key_pem, fake_server, tmp_path):
+    async def run():
+        client = AsyncMemoClient("test", private_key_pem, fake_server.url, retry=RetryPolicy(max_retries=0))
+        outbox = Outbox(str(tmp_path / "outbox.db"))
+        flusher = OutboxFlusher(client, outbox)
+        try:
+            entry_id, _ = outbox.enqueue(await client.prepare_memory("hello", handle="t", description="d"))
+            fake_server.fail_next(1, status=400)
+            flusher.wake()
+            await flusher._task
+
+            rejected = flusher.take_rejected()
+            assert [(r["id"], r["description"]) for r in rejected] == [(entry_id, "d")]
+            assert "400" in rejected[0]["error"]
+            assert flusher.take_rejected() == []
+            assert [r["id"] for r in outbox.failed()] == [entry_id]
+
+            assert outbox.requeue([entry_id]) == 1
+            flusher.wake()
+            await flusher._task
+            assert outbox.counts() == {"pending": 0, "failed": 0}
+            memories, _, _ = await client.get_memories(handle="t")
+            assert [m["content"] for m in memories] == ["hello"]
+        finally:
+            outbox.close()
+            await client.aclose()
+
+    asyncio.run(run())
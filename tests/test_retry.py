@@ -0,0 +1,87 @@
+"""Retry behaviour of both clients against the fake API (benchmarks/fake_server.py)."""
+import time
+
+import pytest
+
+from yomemoai_mcp.errors import MemoRequestError
+from yomemoai_mcp.retry import RetryPolicy
+
+# Tiny backoff so tests are fast; Retry-After (when sent) dominates it.
+FAST = dict(max_retries=2, backoff_base=0.001, backoff_max=0.001)
+
+
+@pytest.fixture
+def runner_factory(runner_factory):
+    """Runners without a page cache, retrying per ``FAST`` plus any overrides."""
+    def make(**retry):
+        return runner_factory(page_cache_size=0, retry=RetryPolicy(**{**FAST, **retry}))
+
+    return make
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_load_retries_then_succeeds(runner_factory, fake_server, status):
+    runner = runner_factory()
+    runner.add("hello")
+    fake_server.requests = 0
+    fake_server.fail_next(2, status=status)
+
+    memories, _, _ = runner.load()
+
+    assert [m["content"] for m in memories] == ["hello"]
+    assert fake_server.requests == 3
+
+
+def test_idempotent_save_retries_then_succeeds(runner_factory, fake_server):
+    runner = runner_factory()
+    fake_server.fail_next(1, status=503)
+
+    runner.add("hello", idempotent_key="key-1")
+
+    assert fake_server.requests == 2
+    assert len(fake_server.memories) == 1
+
+
+def test_retry_after_is_honoured(runner_factory, fake_server):
+    runner = runner_factory()
+    fake_server.fail_next(1, status=429, retry_after="0.3")
+
+    start = time.monotonic()
+    runner.load()
+
+    assert time.monotonic() - start >= 0.3
+    assert fake_server.requests == 2
+
+
+def test_save_without_idempotent_key_is_not_retried(runner_factory, fake_server):
+    runner = runner_factory()
+    fake_server.fail_next(1, status=503)
+
+    with pytest.raises(MemoRequestError) as excinfo:
+        runner.add("hello")
+
+    assert excinfo.value.status_code == 503
+    assert fake_server.requests == 1
+    assert fake_server.memories == []
+
+
+def test_retries_stop_at_max_retries(runner_factory, fake_server):
+    runner = runner_factory(max_retries=2)
+    fake_server.fail_next(10, status=503)
+
+    with pytest.raises(MemoRequestError) as excinfo:
+        runner.add("hello", idempotent_key="key-1")
+
+    assert excinfo.value.status_code == 503
+    assert fake_server.requests == 3
+
+
+def test_refused_connection_is_retried_without_idempotent_key(runner_factory, caplog):
+    runner = runner_factory(max_retries=2)
+    runner.client.base_url = "http://127.0.0.1:1"  # nothing listens on port 1
+
+    with caplog.at_level("WARNING", logger="yomemoai_mcp.client"), pytest.raises(Exception):
+        runner.add("hello")
+
+    # Nothing reached a server, so even a save without idempotent_key is retried.
+    assert sum("Retrying POST" in r.getMessage() for r in caplog.records) == 2
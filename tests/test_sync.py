@@ -0,0 +1,65 @@
+"""Delta sync and the local store of both clients against the fake API (benchmarks/fake_server.py)."""
+import pytest
+
+from yomemoai_mcp.retry import RetryPolicy
+from yomemoai_mcp.sync_store import SyncStore
+
+NO_RETRY = RetryPolicy(max_retries=0)
+
+
+@pytest.fixture
+def runner_factory(runner_factory):
+    """Runners without retries; ``store`` is the client's sync store."""
+    def make(store=None, url=None):
+        return runner_factory(url=url, retry=NO_RETRY, sync_store=store)
+
+    return make
+
+
+def test_repeat_sync_downloads_no_content(runner_factory, fake_server):
+    runner = runner_factory(SyncStore())
+    for i in range(3):
+        runner.add("memory %d" % i)
+    assert len(runner.sync()) == 3
+
+    fake_server.requests = 0
+    assert runner.sync() == []
+    assert fake_server.requests == 1  # one metadata page
+
+
+def test_own_update_is_visible_at_once(runner_factory):
+    runner = runner_factory(SyncStore())
+    for i in range(3):
+        runner.add("memory %d" % i, idempotent_key="idem-%d" % i)
+    runner.sync()
+
+    runner.add("changed", idempotent_key="idem-1")
+    assert runner.client.sync_store.get("2")["content"] == "changed"
+
+    runner.sync()
+    assert runner.client.sync_store.get("2")["content"] == "changed"
+    assert runner.find("2")["content"] == "changed"
+
+
+def test_update_from_another_device_is_synced(runner_factory):
+    runner = runner_factory(SyncStore())
+    other = runner_factory()
+    for i in range(3):
+        runner.add("memory %d" % i, idempotent_key="idem-%d" % i)
+    runner.sync()
+
+    other.add("changed elsewhere", idempotent_key="idem-0")
+    assert runner.find("1")["content"] == "changed elsewhere"
+
+    changed = runner.sync()
+
+    assert [m["id"] for m in changed] == ["1"]
+    assert runner.client.sync_store.get("1")["content"] == "changed elsewhere"
+
+
+def test_find_memory_falls_back_to_the_store_offline(runner_factory, fake_server):
+    store = SyncStore()
+    runner_factory(store).add("kept locally", idempotent_key="idem-0")
+    offline = runner_factory(store, url="http://127.0.0.1:9")
+
+    assert offline.find("1")["content"] == "kept locally"